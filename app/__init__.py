@@ -3,6 +3,8 @@
 import importlib.util
 import logging
 import os
+import weakref
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 from flask import Blueprint, Flask
@@ -15,6 +17,13 @@ _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _DATASPACES_DIR = os.path.join(_REPO_ROOT, 'dataspaces')
 
 
+@lru_cache(maxsize=None)
+def _log_level(name: str) -> int:
+    """Resolve a LOG_LEVEL name to a logging level, defaulting to INFO."""
+    level = getattr(logging, str(name).upper(), None)
+    return level if isinstance(level, int) else logging.INFO
+
+
 def _load_dataspace(app: Flask) -> None:
     """Load the selected dataspace's config, static files, and template overrides."""
     name = os.environ.get('DATASPACE', 'humanitarian')
@@ -71,17 +80,13 @@ def _seed_default_fdps(session) -> None:
     """Populate a new session with the configured default FDP endpoints."""
     from concurrent.futures import ThreadPoolExecutor, as_completed
     from flask import current_app
-    from app.services import FDPClient
-    from app.utils import get_uri_hash
+    from app.utils import get_fdp_client, get_uri_hash
 
     default_uris = current_app.config.get('DEFAULT_FDPS', [])
     if not default_uris:
         return
 
-    client = FDPClient(
-        timeout=current_app.config.get('FDP_TIMEOUT', 30),
-        verify_ssl=current_app.config.get('FDP_VERIFY_SSL', True),
-    )
+    client = get_fdp_client()
 
     def _fetch(uri):
         try:
@@ -126,12 +131,35 @@ def create_app(config_override: Optional[Dict[str, Any]] = None) -> Flask:
     from flask_session import Session
     Session(app)
 
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, app.config.get('LOG_LEVEL', 'INFO')),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # Shared FDP client, reused across requests instead of built per route call
+    from app.services import FDPClient
+    from app.services.fdp_client import RDF_CACHE_MAX_TRIPLES
+    app.extensions['fdp_client'] = FDPClient(
+        timeout=app.config.get('FDP_TIMEOUT', 30),
+        verify_ssl=app.config.get('FDP_VERIFY_SSL', True),
+        parallel_mode=app.config.get('FDP_PARALLEL_MODE', 'thread'),
+        rdf_cache_triples=app.config.get('FDP_RDF_CACHE_TRIPLES', RDF_CACHE_MAX_TRIPLES),
+        process_workers=app.config.get('FDP_PROCESS_WORKERS') or None,
+    )
+    # Close the client with the app, or at interpreter exit if the app outlives
+    # it; unlike atexit.register, nothing accumulates per create_app call
+    weakref.finalize(app, app.extensions['fdp_client'].close)
+
+    # Server-side dataset cache; sessions only hold a key into it
+    from app.utils import DatasetCache
+    app.extensions['dataset_cache'] = DatasetCache(
+        app.config.get('DATASET_CACHE_DIR')
+        or os.path.join(app.root_path, 'data', 'dataset_cache'),
+        default_timeout=app.config.get('DATASET_CACHE_TIMEOUT', 3600),
     )
 
+    # Configure logging (once; repeated factory calls must not reconfigure it)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=_log_level(app.config.get('LOG_LEVEL', 'INFO')),
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
     # Register blueprints
     from app.routes.main import main_bp
     from app.routes.fdp import fdp_bp
@@ -151,22 +179,20 @@ def create_app(config_override: Optional[Dict[str, Any]] = None) -> Flask:
     app.register_blueprint(admin_bp)
     app.register_blueprint(dashboard_bp)
 
-    # Initialize session defaults
+    # Seed new sessions with the default FDPs. Other session keys are created
+    # lazily where they are first written, so static and read-only requests
+    # leave the session untouched.
     @app.before_request
     def init_session():
-        from flask import session
+        from flask import request, session
+        from app.utils import migrate_legacy_uri_hashes
+        if request.endpoint and request.endpoint.endswith('static'):
+            return
+        migrate_legacy_uri_hashes(session)
         if 'fdps' not in session:
             session['fdps'] = {}
             # Seed default FDPs for new sessions
             _seed_default_fdps(session)
-        if 'basket' not in session:
-            session['basket'] = []
-        if 'datasets_cache' not in session:
-            session['datasets_cache'] = []
-        if 'endpoint_credentials' not in session:
-            session['endpoint_credentials'] = {}
-        if 'discovered_endpoints' not in session:
-            session['discovered_endpoints'] = {}
 
     # Ensure dashboard data directory exists
     os.makedirs(os.path.join(app.root_path, 'data', 'dashboard'), exist_ok=True)
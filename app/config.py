@@ -6,6 +6,8 @@ import secrets
 
 from dotenv import load_dotenv
 
+# Runs once per process (module import); variables already set in the
+# environment are left untouched.
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -19,9 +21,19 @@ class Config:
     FDP_TIMEOUT: int = int(os.environ.get('FDP_TIMEOUT', 30))
     LOG_LEVEL: str = os.environ.get('LOG_LEVEL', 'INFO')
     FDP_VERIFY_SSL: bool = os.environ.get('FDP_VERIFY_SSL', 'false').lower() != 'false'
+    # 'thread' or 'process': how linked FDPs of an index are fetched and parsed
+    FDP_PARALLEL_MODE: str = os.environ.get('FDP_PARALLEL_MODE', 'thread')
+    # Worker processes for FDP_PARALLEL_MODE='process'; 0 uses the CPU count
+    FDP_PROCESS_WORKERS: int = int(os.environ.get('FDP_PROCESS_WORKERS', 0))
+    # Total triples of parsed FDP documents kept in memory; 0 disables the cache
+    FDP_RDF_CACHE_TRIPLES: int = int(os.environ.get('FDP_RDF_CACHE_TRIPLES', 200_000))
 
     # DEFAULT_FDPS is supplied by the selected dataspace (see dataspaces/<name>/config.py).
 
+    # Server-side dataset cache (the session only stores a key into it)
+    DATASET_CACHE_DIR: str = os.environ.get('DATASET_CACHE_DIR', '')
+    DATASET_CACHE_TIMEOUT: int = int(os.environ.get('DATASET_CACHE_TIMEOUT', 3600))
+
     # SPARQL settings
     SPARQL_TIMEOUT: int = int(os.environ.get('SPARQL_TIMEOUT', 60))
 
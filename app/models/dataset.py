@@ -1,11 +1,13 @@
 """Data models for Datasets, Distributions, and Contact Points."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
+from app.models.serialization import fast_to_dict
 
-@dataclass
+
+@fast_to_dict()
+@dataclass(slots=True)
 class ContactPoint:
     """Contact information for data requests."""
 
@@ -13,16 +15,9 @@ class ContactPoint:
     email: Optional[str] = None
     url: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'name': self.name,
-            'email': self.email,
-            'url': self.url,
-        }
-
 
-@dataclass
+@fast_to_dict(nested=('contact_point',))
+@dataclass(slots=True)
 class Distribution:
     """Represents a DCAT Distribution with access and endpoint metadata."""
 
@@ -41,23 +36,6 @@ class Distribution:
     # Contact at distribution level
     contact_point: Optional[ContactPoint] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'uri': self.uri,
-            'title': self.title,
-            'description': self.description,
-            'access_url': self.access_url,
-            'download_url': self.download_url,
-            'media_type': self.media_type,
-            'format': self.format,
-            'byte_size': self.byte_size,
-            'endpoint_url': self.endpoint_url,
-            'endpoint_description': self.endpoint_description,
-            'is_sparql_endpoint': self.is_sparql_endpoint,
-            'contact_point': self.contact_point.to_dict() if self.contact_point else None,
-        }
-
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Distribution':
         """Create a Distribution from a dictionary."""
@@ -85,7 +63,8 @@ class Distribution:
         )
 
 
-@dataclass
+@fast_to_dict(nested=('contact_point',), nested_lists=('distributions',))
+@dataclass(slots=True)
 class Dataset:
     """Represents a DCAT Dataset with all relevant metadata for discovery."""
 
@@ -100,15 +79,23 @@ class Dataset:
     description: Optional[str] = None
     publisher: Optional[str] = None
     creator: Optional[str] = None
-    issued: Optional[datetime] = None
-    modified: Optional[datetime] = None
-    themes: List[str] = field(default_factory=list)
-    theme_labels: List[str] = field(default_factory=list)
-    keywords: List[str] = field(default_factory=list)
+    # ISO-8601 strings, kept as literals so they sort chronologically
+    issued: Optional[str] = None
+    modified: Optional[str] = None
+    # Read-only after construction, so stored as tuples
+    themes: Tuple[str, ...] = ()
+    theme_labels: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
     contact_point: Optional[ContactPoint] = None
     landing_page: Optional[str] = None
     distributions: List[Distribution] = field(default_factory=list)
 
+    def __post_init__(self):
+        """Normalize list inputs (tests, session data) to tuples."""
+        self.themes = tuple(self.themes)
+        self.theme_labels = tuple(self.theme_labels)
+        self.keywords = tuple(self.keywords)
+
     @property
     def sparql_endpoints(self) -> List[Distribution]:
         """Get distributions that are SPARQL endpoints."""
@@ -126,29 +113,6 @@ class Dataset:
                     emails.append(dist.contact_point.email)
         return emails
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'uri': self.uri,
-            'title': self.title,
-            'description': self.description,
-            'publisher': self.publisher,
-            'creator': self.creator,
-            'issued': self.issued.isoformat() if self.issued else None,
-            'modified': self.modified.isoformat() if self.modified else None,
-            'themes': self.themes,
-            'theme_labels': self.theme_labels,
-            'keywords': self.keywords,
-            'contact_point': self.contact_point.to_dict() if self.contact_point else None,
-            'landing_page': self.landing_page,
-            'catalog_uri': self.catalog_uri,
-            'catalog_title': self.catalog_title,
-            'catalog_homepage': self.catalog_homepage,
-            'fdp_uri': self.fdp_uri,
-            'fdp_title': self.fdp_title,
-            'distributions': [d.to_dict() for d in self.distributions],
-        }
-
     def to_minimal_dict(self) -> Dict[str, Any]:
         """Convert to minimal dictionary for session caching (to reduce size)."""
         return {
@@ -160,7 +124,10 @@ class Dataset:
             'fdp_uri': self.fdp_uri,
             'fdp_title': self.fdp_title,
             'description': self.description,
+            'issued': self.issued,
+            'modified': self.modified,
             'themes': self.themes,
+            'theme_labels': self.theme_labels,
             'keywords': self.keywords,
             'contact_point': self.contact_point.to_dict() if self.contact_point else None,
             'landing_page': self.landing_page,
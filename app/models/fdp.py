@@ -2,10 +2,13 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional
 
+from app.models.serialization import fast_to_dict
 
-@dataclass
+
+@fast_to_dict(dates=('last_fetched',))
+@dataclass(slots=True)
 class FairDataPoint:
     """Represents a FAIR Data Point endpoint."""
 
@@ -20,23 +23,9 @@ class FairDataPoint:
     status: str = 'pending'
     error_message: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'uri': self.uri,
-            'title': self.title,
-            'description': self.description,
-            'publisher': self.publisher,
-            'is_index': self.is_index,
-            'catalogs': self.catalogs,
-            'linked_fdps': self.linked_fdps,
-            'last_fetched': self.last_fetched.isoformat() if self.last_fetched else None,
-            'status': self.status,
-            'error_message': self.error_message,
-        }
-
 
-@dataclass
+@fast_to_dict()
+@dataclass(slots=True)
 class Catalog:
     """Represents a DCAT Catalog within an FDP."""
 
@@ -51,16 +40,3 @@ class Catalog:
     homepage: Optional[str] = None
     datasets: List[str] = field(default_factory=list)
     themes: List[str] = field(default_factory=list)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'uri': self.uri,
-            'title': self.title,
-            'description': self.description,
-            'publisher': self.publisher,
-            'homepage': self.homepage,
-            'fdp_uri': self.fdp_uri,
-            'datasets': self.datasets,
-            'themes': self.themes,
-        }
@@ -116,7 +116,7 @@ def configure_credentials(fdp_hash: str) -> str:
     """Configure credentials for a specific FDP endpoint.
 
     Args:
-        fdp_hash: The MD5 hash of the FDP URI.
+        fdp_hash: The hash of the FDP URI.
 
     Returns:
         Rendered form or redirect on success.
@@ -164,10 +164,7 @@ def configure_credentials(fdp_hash: str) -> str:
             password = existing['password']
 
         # Store credentials in session
-        if 'endpoint_credentials' not in session:
-            session['endpoint_credentials'] = {}
-
-        session['endpoint_credentials'][fdp_hash] = {
+        session.setdefault('endpoint_credentials', {})[fdp_hash] = {
             'fdp_uri': fdp['uri'],
             'sparql_endpoint': sparql_endpoint,
             'username': username,
@@ -193,7 +190,7 @@ def remove_credentials(fdp_hash: str) -> str:
     """Remove credentials for an FDP endpoint.
 
     Args:
-        fdp_hash: The MD5 hash of the FDP URI.
+        fdp_hash: The hash of the FDP URI.
 
     Returns:
         Redirect to credentials list.
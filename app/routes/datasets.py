@@ -1,13 +1,33 @@
 """Dataset browsing routes."""
 
+import dataclasses
+import hashlib
+import heapq
 import logging
-
-from flask import Blueprint, render_template, request, session, flash, redirect, url_for
-
-from app.config import Config
-from app.models import Dataset, ContactPoint, Distribution
-from app.services import FDPClient, DatasetService
-from app.utils import get_uri_hash
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from flask import Blueprint, g, render_template, request, session, flash, redirect, url_for
+
+from app.models import Dataset, ContactPoint
+from app.services import DatasetService, FDPClient
+from app.services.dataset_service import (
+    CACHED_DATASET_FIELDS,
+    CachedDataset,
+    SearchIndex,
+    to_cached_dataset,
+)
+from app.utils import (
+    get_basket_uris,
+    get_dataset_cache,
+    get_fdp_client,
+    get_uri_hash,
+    pop_if_present,
+    set_basket,
+    set_if_changed,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,15 +35,120 @@ datasets_bp = Blueprint('datasets', __name__, url_prefix='/datasets')
 
 DATASETS_PER_PAGE = 10
 
+# Dataset fields copied straight from a cached row by dataset_from_cache;
+# contact_point is rebuilt as an object.
+_DATASET_CACHED_FIELDS = tuple(
+    f.name for f in dataclasses.fields(Dataset)
+    if f.name in CACHED_DATASET_FIELDS and f.name != 'contact_point'
+)
 
-def get_cached_datasets() -> list:
-    """Get datasets from cache, fetching if needed."""
-    return session.get('datasets_cache', [])
+# Search indexes kept in-process, keyed by dataset cache generation.
+SEARCH_INDEX_CACHE_SIZE = 16
+_search_indexes: OrderedDict = OrderedDict()
+_search_indexes_lock = threading.Lock()
 
+# Sort key and direction for each ``sort`` option on the browse page.
+SORT_KEYS = {
+    'title': (lambda d: d.title_key, False),
+    'modified': (lambda d: d.modified or '', True),
+    'fdp': (lambda d: (d.fdp_title or '').lower(), False),
+}
 
-def dataset_from_dict(data: dict) -> Dataset:
-    """Reconstruct Dataset from dictionary."""
-    contact_data = data.get('contact_point')
+
+def get_cached_datasets() -> list:
+    """Get datasets from the server-side cache for this session's FDPs.
+
+    The payload is loaded at most once per request and kept on ``g``.
+    """
+    if 'datasets_cache' not in g:
+        key = session.get('datasets_cache_key')
+        payload = get_dataset_cache().get(key) if key else None
+        rows = []
+        generation = None
+        # Entries written with a different row layout are treated as misses
+        if isinstance(payload, dict) and payload.get('fields') == list(CACHED_DATASET_FIELDS):
+            rows = [CachedDataset._make(row) for row in payload['rows']]
+            generation = payload.get('generation')
+        g.datasets_cache = rows
+        g.datasets_generation = generation
+    return g.datasets_cache
+
+
+def get_search_index() -> SearchIndex:
+    """Get the search index for this session's cached datasets.
+
+    Indexes are kept in-process per cache generation, so repeated queries
+    against the same dataset cache reuse one index.
+    """
+    cached = get_cached_datasets()
+    generation = g.get('datasets_generation')
+    if generation is None:
+        return SearchIndex(cached)
+
+    with _search_indexes_lock:
+        index = _search_indexes.get(generation)
+        if index is not None:
+            _search_indexes.move_to_end(generation)
+            return index
+
+    index = SearchIndex(cached)
+    with _search_indexes_lock:
+        _search_indexes[generation] = index
+        if len(_search_indexes) > SEARCH_INDEX_CACHE_SIZE:
+            _search_indexes.popitem(last=False)
+    return index
+
+
+def get_cached_facets() -> dict:
+    """Get the theme and application filter options for the cached datasets.
+
+    They are computed once per cache generation and stored next to the
+    datasets, so page views and filter changes do not re-aggregate them.
+    """
+    if 'datasets_facets' not in g:
+        key = session.get('datasets_cache_key')
+        facets = get_dataset_cache().get(f'{key}:facets') if key else None
+        if facets is None:
+            facets = _build_facets(get_cached_datasets())
+            if key:
+                get_dataset_cache().set(f'{key}:facets', facets)
+        g.datasets_facets = facets
+    return g.datasets_facets
+
+
+def _build_facets(cached: list) -> dict:
+    """Aggregate the filter dropdown options over all cached datasets."""
+    return {
+        'themes': [t.to_dict() for t in DatasetService.get_available_themes(cached)],
+        'applications': [
+            a.to_dict() for a in DatasetService.get_available_applications(cached)
+        ],
+    }
+
+
+def clear_cached_datasets() -> None:
+    """Forget this session's dataset cache so it is rebuilt on next browse."""
+    pop_if_present(session, 'datasets_cache_key')
+    g.pop('datasets_cache', None)
+    g.pop('datasets_generation', None)
+    g.pop('datasets_facets', None)
+    g.pop('datasets_by_hash', None)
+
+
+def _index_by_hash() -> dict:
+    """Map URI hash -> cached dataset dict for the current request.
+
+    Built once per request and kept on ``g`` so lookups are a dict index
+    rather than a scan that rehashes every cached URI.
+    """
+    if 'datasets_by_hash' not in g:
+        g.datasets_by_hash = {d.uri_hash: d for d in get_cached_datasets()}
+    return g.datasets_by_hash
+
+
+def dataset_from_cache(row: CachedDataset) -> Dataset:
+    """Reconstruct a Dataset from its cached row."""
+    contact_data = row.contact_point
     contact_point = None
     if contact_data:
         contact_point = ContactPoint(
@@ -32,46 +157,22 @@ def dataset_from_dict(data: dict) -> Dataset:
             url=contact_data.get('url'),
         )
 
-    # Reconstruct distributions (may be dicts or strings from older cache)
-    raw_dists = data.get('distributions', [])
-    distributions = []
-    for d in raw_dists:
-        if isinstance(d, dict):
-            distributions.append(Distribution.from_dict(d))
-        elif isinstance(d, str):
-            distributions.append(Distribution(uri=d))
-
-    return Dataset(
-        uri=data['uri'],
-        title=data['title'],
-        catalog_uri=data['catalog_uri'],
-        catalog_title=data.get('catalog_title'),
-        catalog_homepage=data.get('catalog_homepage'),
-        fdp_uri=data['fdp_uri'],
-        fdp_title=data['fdp_title'],
-        description=data.get('description'),
-        publisher=data.get('publisher'),
-        creator=data.get('creator'),
-        issued=None,
-        modified=None,
-        themes=data.get('themes', []),
-        theme_labels=data.get('theme_labels', []),
-        keywords=data.get('keywords', []),
-        contact_point=contact_point,
-        landing_page=data.get('landing_page'),
-        distributions=distributions,
-    )
+    fields = {name: getattr(row, name) for name in _DATASET_CACHED_FIELDS}
+    return Dataset(contact_point=contact_point, **fields)
+
 
+def fetch_all_datasets(client: Optional[FDPClient] = None) -> list:
+    """Fetch all datasets from configured FDPs.
 
-def fetch_all_datasets() -> list:
-    """Fetch all datasets from configured FDPs."""
+    Args:
+        client: FDP client to crawl with; defaults to the app's client.
+    """
     fdps = session.get('fdps', {})
 
     if not fdps:
         return []
 
-    client = FDPClient(timeout=Config.FDP_TIMEOUT, verify_ssl=Config.FDP_VERIFY_SSL)
-    service = DatasetService(client)
+    service = DatasetService(client or get_fdp_client())
 
     # Get list of FDP URIs
     fdp_uris = [fdp_data['uri'] for fdp_data in fdps.values()]
@@ -79,12 +180,27 @@ def fetch_all_datasets() -> list:
     # Fetch all datasets
     datasets = service.get_all_datasets(fdp_uris)
 
-    # Cache minimal info in session to avoid cookie size issues
-    datasets_dicts = [ds.to_minimal_dict() for ds in datasets]
-    session['datasets_cache'] = datasets_dicts
-    session.modified = True
-
-    return datasets_dicts
+    # Cache compact rows server-side; the session only carries their key
+    cached = [to_cached_dataset(ds) for ds in datasets]
+    cache_key = hashlib.blake2b(
+        ','.join(sorted(fdp_uris)).encode('utf-8'), digest_size=8
+    ).hexdigest()
+    facets = _build_facets(cached)
+    generation = uuid.uuid4().hex
+    get_dataset_cache().set(cache_key, {
+        'fields': list(CACHED_DATASET_FIELDS),
+        'generation': generation,
+        'rows': cached,
+    })
+    get_dataset_cache().set(f'{cache_key}:facets', facets)
+    set_if_changed(session, 'datasets_cache_key', cache_key)
+    pop_if_present(session, 'datasets_cache')
+    g.datasets_cache = cached
+    g.datasets_generation = generation
+    g.datasets_facets = facets
+    g.pop('datasets_by_hash', None)
+
+    return cached
 
 
 @datasets_bp.route('/')
@@ -98,45 +214,38 @@ def browse():
     page = request.args.get('page', 1, type=int)
 
     # Get datasets from cache
-    datasets_dicts = get_cached_datasets()
+    cached = get_cached_datasets()
 
-    if not datasets_dicts:
+    if not cached:
         # Try to fetch if we have FDPs configured
         fdps = session.get('fdps', {})
         if fdps:
-            datasets_dicts = fetch_all_datasets()
-
-    # Convert to Dataset objects for filtering
-    datasets = [dataset_from_dict(d) for d in datasets_dicts]
+            cached = fetch_all_datasets()
 
-    # Initialize service for filtering (no client needed for filtering)
-    client = FDPClient(timeout=Config.FDP_TIMEOUT, verify_ssl=Config.FDP_VERIFY_SSL)
-    service = DatasetService(client)
+    # Filter and sort the cached rows directly; only the visible page is
+    # rehydrated into Dataset objects below.
+    datasets = list(cached)
 
-    # Get available themes and applications before filtering so the dropdowns
-    # reflect the full universe, not the current subset.
-    themes = service.get_available_themes(datasets)
-    applications = service.get_available_applications(datasets)
+    # Available themes and applications cover the full universe, not the
+    # current subset, and are cached alongside the datasets.
+    facets = get_cached_facets()
+    themes = facets['themes']
+    applications = facets['applications']
 
     # Apply search filter
     if query:
-        datasets = service.search(datasets, query)
+        datasets = get_search_index().search(query)
 
-    # Apply theme filter
+    # Apply theme filter (an index lookup unless a search narrowed the list)
     if theme_filter:
-        datasets = service.filter_by_theme(datasets, theme_filter)
+        if query:
+            datasets = DatasetService.filter_by_theme(datasets, theme_filter)
+        else:
+            datasets = get_search_index().with_theme(theme_filter)
 
     # Apply application (catalog homepage) filter
     if app_filter:
-        datasets = service.filter_by_application(datasets, app_filter)
-
-    # Sort datasets
-    if sort_by == 'title':
-        datasets.sort(key=lambda d: (d.title or '').lower())
-    elif sort_by == 'modified':
-        datasets.sort(key=lambda d: d.modified or '', reverse=True)
-    elif sort_by == 'fdp':
-        datasets.sort(key=lambda d: (d.fdp_title or '').lower())
+        datasets = DatasetService.filter_by_application(datasets, app_filter)
 
     # Pagination
     total_datasets = len(datasets)
@@ -145,11 +254,21 @@ def browse():
 
     start_idx = (page - 1) * DATASETS_PER_PAGE
     end_idx = start_idx + DATASETS_PER_PAGE
-    paginated_datasets = datasets[start_idx:end_idx]
+
+    # Sort datasets. For early pages only the first end_idx items need to be
+    # ordered, so a partial heap sort replaces sorting the whole list.
+    if sort_by in SORT_KEYS:
+        key_fn, reverse = SORT_KEYS[sort_by]
+        if end_idx < total_datasets // 4:
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            datasets = select(end_idx, datasets, key=key_fn)
+        else:
+            datasets.sort(key=key_fn, reverse=reverse)
+
+    paginated_datasets = [dataset_from_cache(d) for d in datasets[start_idx:end_idx]]
 
     # Get basket items for highlighting
-    basket = session.get('basket', [])
-    basket_uris = {item['uri'] for item in basket}
+    basket_uris = get_basket_uris(session)
 
     return render_template(
         'datasets/browse.html',
@@ -178,8 +297,9 @@ def refresh():
         return redirect(url_for('datasets.browse'))
 
     try:
-        datasets_dicts = fetch_all_datasets()
-        flash(f'Successfully refreshed {len(datasets_dicts)} dataset(s).', 'success')
+        # An explicit refresh revalidates every document it crawls
+        cached = fetch_all_datasets(get_fdp_client().revalidating())
+        flash(f'Successfully refreshed {len(cached)} dataset(s).', 'success')
     except Exception as e:
         flash('Error refreshing datasets. Please try again.', 'error')
 
@@ -190,57 +310,50 @@ def refresh():
 def detail(uri_hash: str):
     """Show dataset detail view."""
     # Find dataset in cache (minimal info)
-    datasets_dicts = get_cached_datasets()
-
-    dataset_dict = None
-    for d in datasets_dicts:
-        if get_uri_hash(d['uri']) == uri_hash:
-            dataset_dict = d
-            break
+    cached = get_cached_datasets()
+    cached_ds = _index_by_hash().get(uri_hash)
 
-    if not dataset_dict:
+    if not cached_ds:
         flash('Dataset not found.', 'error')
         return redirect(url_for('datasets.browse'))
 
     # Re-fetch full dataset details from the FDP (includes distribution parsing)
-    client = FDPClient(timeout=Config.FDP_TIMEOUT, verify_ssl=Config.FDP_VERIFY_SSL)
     try:
-        dataset = client.fetch_dataset(
-            dataset_dict['uri'],
-            dataset_dict['catalog_uri'],
-            dataset_dict['fdp_uri'],
-            dataset_dict['fdp_title']
+        dataset = get_fdp_client().fetch_dataset(
+            cached_ds.uri,
+            cached_ds.catalog_uri,
+            cached_ds.fdp_uri,
+            cached_ds.fdp_title
         )
         # Restore catalog fields that fetch_dataset doesn't see.
-        dataset.catalog_title = dataset_dict.get('catalog_title')
-        dataset.catalog_homepage = dataset_dict.get('catalog_homepage')
+        dataset.catalog_title = cached_ds.catalog_title
+        dataset.catalog_homepage = cached_ds.catalog_homepage
         # Store discovered SPARQL endpoints in session for credential auto-population
         _store_discovered_endpoints(dataset)
     except Exception as e:
         logger.error(f"Error fetching dataset details: {e}")
         # Fallback to cached minimal data
-        dataset = dataset_from_dict(dataset_dict)
+        dataset = dataset_from_cache(cached_ds)
 
     # Find siblings — other cached datasets in the same application.
     siblings_by_fdp: dict = {}
     if dataset.catalog_homepage:
-        for d in datasets_dicts:
-            if d.get('catalog_homepage') != dataset.catalog_homepage:
+        for d in cached:
+            if d.catalog_homepage != dataset.catalog_homepage:
                 continue
-            if d['uri'] == dataset.uri:
+            if d.uri == dataset.uri:
                 continue
-            fdp_title = d.get('fdp_title') or d.get('fdp_uri') or ''
+            fdp_title = d.fdp_title or d.fdp_uri or ''
             siblings_by_fdp.setdefault(fdp_title, []).append({
-                'uri': d['uri'],
-                'uri_hash': get_uri_hash(d['uri']),
-                'title': d['title'],
+                'uri': d.uri,
+                'uri_hash': d.uri_hash,
+                'title': d.title,
                 'fdp_title': fdp_title,
             })
 
     # Check if in basket
-    basket = session.get('basket', [])
-    in_basket = any(item['uri'] == dataset.uri for item in basket)
-    basket_uris = {item['uri'] for item in basket}
+    basket_uris = get_basket_uris(session)
+    in_basket = dataset.uri in basket_uris
 
     return render_template(
         'datasets/detail.html',
@@ -260,32 +373,30 @@ def add_application_to_basket():
         flash('No application selected.', 'error')
         return redirect(url_for('datasets.browse'))
 
-    datasets_dicts = get_cached_datasets()
+    cached = get_cached_datasets()
     basket = session.get('basket', [])
-    existing_uris = {item['uri'] for item in basket}
+    existing_uris = get_basket_uris(session)
 
     added = 0
-    for d in datasets_dicts:
-        if d.get('catalog_homepage') != homepage:
+    for d in cached:
+        if d.catalog_homepage != homepage:
             continue
-        if d['uri'] in existing_uris:
+        if d.uri in existing_uris:
             continue
-        uri_hash = get_uri_hash(d['uri'])
         basket.append({
-            'uri': d['uri'],
-            'uri_hash': uri_hash,
-            'title': d['title'],
-            'fdp_title': d['fdp_title'],
-            'catalog_uri': d.get('catalog_uri'),
-            'catalog_title': d.get('catalog_title'),
-            'catalog_homepage': d.get('catalog_homepage'),
-            'contact_point': d.get('contact_point'),
+            'uri': d.uri,
+            'uri_hash': d.uri_hash,
+            'title': d.title,
+            'fdp_title': d.fdp_title,
+            'catalog_uri': d.catalog_uri,
+            'catalog_title': d.catalog_title,
+            'catalog_homepage': d.catalog_homepage,
+            'contact_point': d.contact_point,
         })
-        existing_uris.add(d['uri'])
+        existing_uris.add(d.uri)
         added += 1
 
-    session['basket'] = basket
-    session.modified = True
+    set_basket(session, basket)
 
     if added:
         flash(f'Added {added} dataset(s) from this application to your basket.', 'success')
@@ -300,8 +411,7 @@ def add_application_to_basket():
 
 def _store_discovered_endpoints(dataset: Dataset) -> None:
     """Store discovered SPARQL endpoints in session for later credential config."""
-    if 'discovered_endpoints' not in session:
-        session['discovered_endpoints'] = {}
+    discovered = dict(session.get('discovered_endpoints', {}))
 
     for dist in dataset.distributions:
         if not dist.is_sparql_endpoint:
@@ -311,7 +421,7 @@ def _store_discovered_endpoints(dataset: Dataset) -> None:
         if not url:
             continue
         endpoint_key = get_uri_hash(url)
-        session['discovered_endpoints'][endpoint_key] = {
+        discovered[endpoint_key] = {
             'endpoint_url': url,
             'dataset_uri': dataset.uri,
             'dataset_title': dataset.title,
@@ -320,57 +430,49 @@ def _store_discovered_endpoints(dataset: Dataset) -> None:
             'distribution_title': dist.title,
         }
 
-    session.modified = True
+    set_if_changed(session, 'discovered_endpoints', discovered)
 
 
 @datasets_bp.route('/<uri_hash>/add-to-basket', methods=['POST'])
 def add_to_basket(uri_hash: str):
     """Add a dataset to the request basket."""
     # Find dataset in cache
-    datasets_dicts = get_cached_datasets()
+    cached_ds = _index_by_hash().get(uri_hash)
 
-    dataset_dict = None
-    for d in datasets_dicts:
-        if get_uri_hash(d['uri']) == uri_hash:
-            dataset_dict = d
-            break
-
-    if not dataset_dict:
+    if not cached_ds:
         flash('Dataset not found.', 'error')
         return redirect(url_for('datasets.browse'))
 
     # Check if already in basket
-    basket = session.get('basket', [])
-    if any(item['uri'] == dataset_dict['uri'] for item in basket):
+    if cached_ds.uri in get_basket_uris(session):
         flash('Dataset is already in your basket.', 'info')
     else:
         # Fetch full dataset to discover SPARQL endpoints
         try:
-            client = FDPClient(timeout=Config.FDP_TIMEOUT, verify_ssl=Config.FDP_VERIFY_SSL)
-            dataset = client.fetch_dataset(
-                dataset_dict['uri'],
-                dataset_dict['catalog_uri'],
-                dataset_dict['fdp_uri'],
-                dataset_dict['fdp_title']
+            dataset = get_fdp_client().fetch_dataset(
+                cached_ds.uri,
+                cached_ds.catalog_uri,
+                cached_ds.fdp_uri,
+                cached_ds.fdp_title
             )
             _store_discovered_endpoints(dataset)
         except Exception as e:
             logger.warning(f"Could not fetch full dataset for endpoint discovery: {e}")
 
         # Add to basket
+        basket = session.get('basket', [])
         basket.append({
-            'uri': dataset_dict['uri'],
+            'uri': cached_ds.uri,
             'uri_hash': uri_hash,
-            'title': dataset_dict['title'],
-            'fdp_title': dataset_dict['fdp_title'],
-            'catalog_uri': dataset_dict.get('catalog_uri'),
-            'catalog_title': dataset_dict.get('catalog_title'),
-            'catalog_homepage': dataset_dict.get('catalog_homepage'),
-            'contact_point': dataset_dict.get('contact_point'),
+            'title': cached_ds.title,
+            'fdp_title': cached_ds.fdp_title,
+            'catalog_uri': cached_ds.catalog_uri,
+            'catalog_title': cached_ds.catalog_title,
+            'catalog_homepage': cached_ds.catalog_homepage,
+            'contact_point': cached_ds.contact_point,
         })
-        session['basket'] = basket
-        session.modified = True
-        flash(f'Added "{dataset_dict["title"]}" to your basket.', 'success')
+        set_basket(session, basket)
+        flash(f'Added "{cached_ds.title}" to your basket.', 'success')
 
     # Redirect back to the referring page
     next_url = request.form.get('next') or request.referrer
@@ -390,8 +492,7 @@ def remove_from_basket(uri_hash: str):
     if len(new_basket) == len(basket):
         flash('Dataset not found in basket.', 'error')
     else:
-        session['basket'] = new_basket
-        session.modified = True
+        set_basket(session, new_basket)
         flash('Removed dataset from basket.', 'success')
 
     # Redirect back to the referring page
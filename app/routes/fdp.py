@@ -2,10 +2,10 @@
 
 from flask import Blueprint, render_template, request, session, flash, redirect, url_for
 
-from app.config import Config
 from app.routes.admin import admin_required
-from app.services import FDPClient, FDPConnectionError, FDPParseError, FDPTimeoutError
-from app.utils import get_uri_hash
+from app.routes.datasets import clear_cached_datasets
+from app.services import FDPConnectionError, FDPParseError, FDPTimeoutError
+from app.utils import get_fdp_client, get_uri_hash
 
 fdp_bp = Blueprint('fdp', __name__, url_prefix='/fdp')
 
@@ -42,7 +42,7 @@ def add():
             return redirect(url_for('fdp.list_fdps'))
 
         # Try to fetch FDP metadata
-        client = FDPClient(timeout=Config.FDP_TIMEOUT, verify_ssl=Config.FDP_VERIFY_SSL)
+        client = get_fdp_client()
 
         try:
             if is_index:
@@ -53,9 +53,7 @@ def add():
                 for fdp in fdps:
                     fdp_hash = get_uri_hash(fdp.uri)
                     if fdp_hash not in session.get('fdps', {}):
-                        if 'fdps' not in session:
-                            session['fdps'] = {}
-                        session['fdps'][fdp_hash] = fdp.to_dict()
+                        session.setdefault('fdps', {})[fdp_hash] = fdp.to_dict()
                         added_count += 1
 
                 session.modified = True
@@ -68,10 +66,7 @@ def add():
                 # Fetch single FDP
                 fdp = client.fetch_fdp(url)
 
-                if 'fdps' not in session:
-                    session['fdps'] = {}
-
-                session['fdps'][uri_hash] = fdp.to_dict()
+                session.setdefault('fdps', {})[uri_hash] = fdp.to_dict()
                 session.modified = True
 
                 flash(f'Successfully added FDP: {fdp.title}', 'success')
@@ -104,29 +99,29 @@ def refresh(uri_hash: str):
     fdp_data = fdps[uri_hash]
     uri = fdp_data['uri']
 
-    client = FDPClient(timeout=Config.FDP_TIMEOUT)
-
+    error_message = None
     try:
-        fdp = client.fetch_fdp(uri)
-        session['fdps'][uri_hash] = fdp.to_dict()
-        session.modified = True
+        # An explicit refresh revalidates instead of trusting max-age
+        fdp = get_fdp_client().revalidating().fetch_fdp(uri)
+        updated = fdp.to_dict()
         flash(f'Successfully refreshed FDP: {fdp.title}', 'success')
     except FDPConnectionError:
-        session['fdps'][uri_hash]['status'] = 'error'
-        session['fdps'][uri_hash]['error_message'] = 'Could not connect'
-        session.modified = True
+        error_message = 'Could not connect'
         flash('Could not connect to the FDP.', 'error')
     except FDPParseError:
-        session['fdps'][uri_hash]['status'] = 'error'
-        session['fdps'][uri_hash]['error_message'] = 'Could not parse metadata'
-        session.modified = True
+        error_message = 'Could not parse metadata'
         flash('Could not parse the FDP metadata.', 'error')
     except FDPTimeoutError:
-        session['fdps'][uri_hash]['status'] = 'error'
-        session['fdps'][uri_hash]['error_message'] = 'Request timed out'
-        session.modified = True
+        error_message = 'Request timed out'
         flash('Request timed out.', 'error')
 
+    if error_message:
+        updated = {**fdp_data, 'status': 'error', 'error_message': error_message}
+
+    # Write the FDP entry back once, and only if the refresh changed it
+    if updated != fdp_data:
+        session['fdps'] = {**fdps, uri_hash: updated}
+
     return redirect(url_for('fdp.list_fdps'))
 
 
@@ -145,7 +140,7 @@ def remove(uri_hash: str):
     session.modified = True
 
     # Also clear datasets cache since FDPs changed
-    session['datasets_cache'] = []
+    clear_cached_datasets()
 
     flash(f'Removed FDP: {fdp_title}', 'success')
     return redirect(url_for('fdp.list_fdps'))
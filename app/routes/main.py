@@ -2,6 +2,7 @@
 
 from flask import Blueprint, render_template, session
 
+from app.routes.datasets import get_cached_datasets
 from app.services.admin_service import get_page_content
 
 main_bp = Blueprint('main', __name__)
@@ -12,10 +13,10 @@ def index():
     """Render the landing page."""
     fdp_count = len(session.get('fdps', {}))
     basket_count = len(session.get('basket', []))
-    datasets_cache = session.get('datasets_cache', [])
+    datasets_cache = get_cached_datasets()
     # None means "not fetched yet this session" so the template shows an em dash.
     distribution_count = (
-        sum(ds.get('distribution_count', 0) for ds in datasets_cache)
+        sum(ds.distribution_count for ds in datasets_cache)
         if datasets_cache else None
     )
     content = get_page_content('home')
@@ -1,9 +1,12 @@
 """Request composition routes."""
 
+from collections import defaultdict
+
 from flask import Blueprint, render_template, request, session, flash, redirect, url_for
 
 from app.models import DataRequest, DatasetReference
 from app.services import EmailComposer
+from app.utils import get_missing_contacts, set_basket
 
 request_bp = Blueprint('request', __name__, url_prefix='/request')
 
@@ -19,6 +22,9 @@ def basket():
     # a single "Other datasets" bucket so they still appear.
     OTHER_KEY = '__other__'
     by_application: dict = {}
+    # Flat by_contact is built in the same pass — email composition
+    # downstream groups by contact.
+    by_contact = defaultdict(list)
 
     for item in basket_items:
         homepage = item.get('catalog_homepage')
@@ -48,32 +54,25 @@ def basket():
         contact = item.get('contact_point', {}) or {}
         email = contact.get('email') or 'No contact email'
         bucket['contacts'].setdefault(email, []).append(item)
+        by_contact[email].append(item)
 
     # Convert the fdps set to a count for the template.
     for bucket in by_application.values():
         bucket['fdp_count'] = len(bucket['fdps'])
         del bucket['fdps']
 
-    # Still expose flat by_contact — email composition downstream groups by contact.
-    by_contact: dict = {}
-    for item in basket_items:
-        contact = item.get('contact_point', {}) or {}
-        email = contact.get('email') or 'No contact email'
-        by_contact.setdefault(email, []).append(item)
-
     return render_template(
         'request/basket.html',
         basket=basket_items,
         by_application=by_application,
-        by_contact=by_contact,
+        by_contact=dict(by_contact),
     )
 
 
 @request_bp.route('/clear', methods=['POST'])
 def clear():
     """Clear the request basket."""
-    session['basket'] = []
-    session.modified = True
+    set_basket(session, [])
     flash('Basket cleared.', 'success')
     return redirect(url_for('request.basket'))
 
@@ -87,12 +86,8 @@ def compose():
         flash('Your basket is empty. Add datasets before composing a request.', 'warning')
         return redirect(url_for('datasets.browse'))
 
-    # Check if all datasets have contact emails
-    missing_contacts = []
-    for item in basket_items:
-        contact = item.get('contact_point', {}) or {}
-        if not contact.get('email'):
-            missing_contacts.append(item['title'])
+    # Datasets without contact emails (recorded whenever the basket is written)
+    missing_contacts = get_missing_contacts(session)
 
     if request.method == 'POST':
         # Get form data
@@ -194,7 +189,7 @@ def preview():
 def finish():
     """Mark the request as complete and clear basket."""
     # Clear basket and composed emails
-    session['basket'] = []
+    set_basket(session, [])
     session['composed_emails'] = []
     session['data_request'] = {}
     session.modified = True
@@ -14,6 +14,7 @@ from app.routes.auth import login_required
 from app.services import SPARQLClient
 from app.models import SPARQLQuery, EndpointCredentials
 from app.config import Config
+from app.utils import get_basket_uris
 
 
 sparql_bp = Blueprint('sparql', __name__, url_prefix='/sparql')
@@ -27,7 +28,7 @@ def _get_basket_endpoints() -> list:
     if not basket or not discovered:
         return []
 
-    basket_uris = {item['uri'] for item in basket}
+    basket_uris = get_basket_uris(session)
     endpoints = []
     seen_urls = set()
 
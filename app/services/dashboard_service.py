@@ -12,9 +12,10 @@ from flask import current_app
 
 from app.config import Config
 from app.models.auth import EndpointCredentials
-from app.services.fdp_client import FDPClient, FDPError
+from app.services.fdp_client import FDPError
 from app.services.dataset_service import DatasetService
 from app.services.sparql_client import SPARQLClient, SPARQLError
+from app.utils import get_fdp_client
 
 logger = logging.getLogger(__name__)
 
@@ -123,11 +124,7 @@ def _transform_stats(bindings: List[Dict]) -> Dict[str, Any]:
 def get_fdp_themes() -> List[Dict[str, Any]]:
     """Extract live themes from the configured FDPs."""
     try:
-        fdp_client = FDPClient(
-            timeout=Config.FDP_TIMEOUT,
-            verify_ssl=Config.FDP_VERIFY_SSL,
-        )
-        dataset_service = DatasetService(fdp_client)
+        dataset_service = DatasetService(get_fdp_client())
         datasets = dataset_service.get_all_datasets(list(current_app.config.get('DEFAULT_FDPS', [])))
         themes = dataset_service.get_available_themes(datasets)
         return [{'label': t.label, 'uri': t.uri, 'count': t.count} for t in themes]
@@ -219,11 +216,7 @@ def discover_endpoints() -> List[Dict[str, str]]:
     """
     logger.info('Starting SPARQL endpoint discovery from FDPs')
 
-    fdp_client = FDPClient(
-        timeout=Config.FDP_TIMEOUT,
-        verify_ssl=Config.FDP_VERIFY_SSL,
-    )
-    dataset_service = DatasetService(fdp_client)
+    dataset_service = DatasetService(get_fdp_client())
 
     fdp_uris = list(current_app.config.get('DEFAULT_FDPS', []))
 
@@ -1,18 +1,65 @@
 """Dataset Service for aggregating and filtering datasets."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from operator import attrgetter
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
 from app.models import Dataset
-from app.services.fdp_client import FDPClient, FDPError
+from app.services.fdp_client import MAX_FETCH_WORKERS, FDPClient, FDPError
+from app.utils import get_uri_hash
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Field order of a cached dataset row: Dataset.to_minimal_dict() plus the
+# lookup and sort keys precomputed when the cache is built.
+CACHED_DATASET_FIELDS = (
+    'uri', 'title', 'catalog_uri', 'catalog_title', 'catalog_homepage',
+    'fdp_uri', 'fdp_title', 'description', 'issued', 'modified', 'themes',
+    'theme_labels', 'keywords', 'contact_point', 'landing_page', 'distribution_count',
+    'uri_hash', 'title_key',
+)
+
+# Compact, fixed-field form of a Dataset held in the dataset cache. Rows are
+# stored as plain arrays, so keys are not repeated per dataset.
+CachedDataset = namedtuple('CachedDataset', CACHED_DATASET_FIELDS)
+
+
+def _field(record: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a Dataset, a CachedDataset or a dict.
+
+    The browse route filters the dataset cache without rehydrating every
+    entry into a Dataset, so the helpers below accept any of these shapes.
+    """
+    if isinstance(record, dict):
+        return record.get(name, default)
+    return getattr(record, name, default)
+
+
+_get_themes = attrgetter('themes')
+_get_theme_labels = attrgetter('theme_labels')
+_get_catalog_homepage = attrgetter('catalog_homepage')
+
+
+def _accessor(
+    records: List[Any], getter: Callable[[Any], Any], name: str, default: Any = None
+) -> Callable[[Any], Any]:
+    """Pick a field accessor for a homogeneous list of records.
+
+    Datasets and CachedDataset rows share attribute names, so the C-level
+    ``attrgetter`` is used for them; dicts fall back to ``_field``.
+    """
+    if records and isinstance(records[0], dict):
+        return lambda record: record.get(name, default)
+    return getter
+
+
+@dataclass(slots=True, frozen=True)
 class Theme:
     """Represents a theme for filtering datasets."""
 
@@ -29,7 +76,7 @@ class Theme:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Application:
     """Represents an 'application' — a catalog identity shared across FDPs.
 
@@ -54,34 +101,244 @@ class Application:
         }
 
 
+def fold_case(text: str) -> str:
+    """Case-fold text for case-insensitive matching.
+
+    Uses ``str.casefold`` so non-ASCII text matches correctly (e.g. German
+    ß and ss); pure-ASCII text takes the faster, equivalent ``str.lower``.
+    """
+    return text.lower() if text.isascii() else text.casefold()
+
+
+def to_cached_dataset(dataset: Dataset) -> CachedDataset:
+    """Convert a Dataset into the row stored in the dataset cache."""
+    data = dataset.to_minimal_dict()
+    return CachedDataset(
+        uri_hash=get_uri_hash(dataset.uri),
+        title_key=(dataset.title or '').lower(),
+        **data,
+    )
+
+
+def _score_terms(
+    terms: List[str],
+    title: str,
+    description: str,
+    keywords: List[str],
+    theme_labels: List[str],
+) -> int:
+    """Relevance score of case-folded dataset fields for case-folded query terms."""
+    score = 0
+    for term in terms:
+        # Title match (highest weight)
+        if term in title:
+            score += 100
+            # Bonus for exact title match
+            if title == term:
+                score += 50
+
+        # Description match
+        if term in description:
+            score += 10
+
+        # Keyword match
+        if any(term in kw for kw in keywords):
+            score += 5
+            # Bonus for exact keyword match
+            if term in keywords:
+                score += 10
+
+        # Theme label match
+        if any(term in tl for tl in theme_labels):
+            score += 5
+    return score
+
+
+# Query terms whose hit sets each SearchIndex remembers.
+HITS_CACHE_SIZE = 256
+
+
+def _ranked_datasets(ranked: Iterable[tuple]) -> List[Any]:
+    """Order ``(-score, title, index, dataset)`` tuples and return the datasets.
+
+    Sorts by score (descending), then title, then original position.
+    """
+    return [entry[3] for entry in sorted(ranked)]
+
+
+class SearchIndex:
+    """Reusable search structure over one list of datasets.
+
+    Case-folds every searchable field once and maps each whitespace-separated
+    token to the datasets whose title, description, keywords or theme labels
+    contain it. Query terms never contain whitespace, so a term occurs in a
+    field exactly when it occurs in one of the field's tokens. Scoring is
+    then a matter of adding each field's weight to the datasets in its hit
+    set, instead of substring-testing every field of every dataset. Results
+    match ``DatasetService.search``.
+    """
+
+    # Index of each field's posting set in the per-token entries
+    _TITLE, _DESCRIPTION, _KEYWORD, _THEME = range(4)
+
+    def __init__(self, datasets: List[Any]):
+        """
+        Build the index.
+
+        Args:
+            datasets: Datasets (or cached rows) to index.
+        """
+        self.datasets = list(datasets)
+        # token -> [title ids, description ids, keyword ids, theme ids]
+        self._tokens: Dict[str, List[set]] = {}
+        # Whole case-folded titles and keywords, for the exact-match bonuses
+        self._exact_titles: Dict[str, set] = {}
+        self._exact_keywords: Dict[str, set] = {}
+        # term -> per-field hit sets, so repeated terms skip the vocabulary scan
+        self._hits_cache: Dict[str, List[set]] = {}
+        self._hits_lock = threading.Lock()
+        # theme URI -> datasets with that theme, in dataset order
+        self._by_theme: Dict[str, List[Any]] = defaultdict(list)
+
+        for idx, ds in enumerate(self.datasets):
+            for theme_uri in dict.fromkeys(_field(ds, 'themes', ())):
+                self._by_theme[theme_uri].append(ds)
+
+            title = fold_case(_field(ds, 'title') or '')
+            keywords = [fold_case(kw) for kw in _field(ds, 'keywords', ())]
+            self._exact_titles.setdefault(title, set()).add(idx)
+            for kw in keywords:
+                self._exact_keywords.setdefault(kw, set()).add(idx)
+
+            self._add_tokens(idx, self._TITLE, [title])
+            self._add_tokens(idx, self._DESCRIPTION, [fold_case(_field(ds, 'description') or '')])
+            self._add_tokens(idx, self._KEYWORD, keywords)
+            self._add_tokens(
+                idx, self._THEME, [fold_case(tl) for tl in _field(ds, 'theme_labels', ())]
+            )
+
+    def with_theme(self, theme_uri: str) -> List[Any]:
+        """
+        Return the indexed datasets that have a theme, in dataset order.
+
+        Same result as ``DatasetService.filter_by_theme`` over all indexed
+        datasets, as a dict lookup.
+
+        Args:
+            theme_uri: Theme URI to filter by.
+
+        Returns:
+            Datasets that have the specified theme.
+        """
+        return list(self._by_theme.get(theme_uri, ()))
+
+    def _add_tokens(self, idx: int, slot: int, texts: List[str]) -> None:
+        """Record dataset idx under every token of texts for one field."""
+        for text in texts:
+            for token in text.split():
+                entry = self._tokens.get(token)
+                if entry is None:
+                    entry = self._tokens[token] = [set(), set(), set(), set()]
+                entry[slot].add(idx)
+
+    def _hits(self, term: str) -> List[set]:
+        """Per-field sets of datasets with a token containing the term."""
+        hits = self._hits_cache.get(term)
+        if hits is not None:
+            return hits
+
+        hits = [set(), set(), set(), set()]
+        for token, entry in self._tokens.items():
+            if term in token:
+                for slot in range(4):
+                    hits[slot] |= entry[slot]
+
+        with self._hits_lock:
+            if len(self._hits_cache) >= HITS_CACHE_SIZE:
+                self._hits_cache.pop(next(iter(self._hits_cache)))
+            self._hits_cache[term] = hits
+        return hits
+
+    def search(self, query: str) -> List[Any]:
+        """
+        Search the indexed datasets.
+
+        Args:
+            query: Search query string (case-insensitive).
+
+        Returns:
+            Matching datasets, ordered by relevance then title.
+        """
+        if not query:
+            return list(self.datasets)
+
+        scores: Dict[int, int] = defaultdict(int)
+        for term in fold_case(query).split():
+            title_hits, desc_hits, kw_hits, theme_hits = self._hits(term)
+            for idx in title_hits:
+                scores[idx] += 100
+            for idx in self._exact_titles.get(term, ()):
+                scores[idx] += 50
+            for idx in desc_hits:
+                scores[idx] += 10
+            for idx in kw_hits:
+                scores[idx] += 5
+            for idx in self._exact_keywords.get(term, ()):
+                scores[idx] += 10
+            for idx in theme_hits:
+                scores[idx] += 5
+
+        # Dataset index as the last tie-break keeps the same order as search()
+        ranked = [
+            (-score, _field(self.datasets[idx], 'title') or '', idx, self.datasets[idx])
+            for idx, score in scores.items()
+        ]
+        return _ranked_datasets(ranked)
+
+
 class DatasetService:
     """Service for aggregating and filtering datasets from FDPs."""
 
-    def __init__(self, fdp_client: FDPClient):
+    def __init__(self, fdp_client: FDPClient, max_workers: int = MAX_FETCH_WORKERS):
         """
         Initialize the dataset service.
 
         Args:
             fdp_client: FDP client for fetching metadata.
+            max_workers: Maximum number of concurrent FDP/catalog fetches.
         """
         self.fdp_client = fdp_client
+        self.max_workers = max_workers
 
     def get_all_datasets(self, fdp_uris: List[str]) -> List[Dataset]:
         """
         Fetch all datasets from the given FDPs.
 
-        Fetches FDPs concurrently, then fetches all discovered catalogs
-        concurrently to minimise total wait time.
-
         Args:
             fdp_uris: List of FDP URIs to fetch from.
 
         Returns:
             List of all datasets from all FDPs.
         """
-        # Step 1: fetch all FDPs concurrently to discover catalogs
-        catalog_tasks = []  # list of (catalog_uri, fdp_uri, fdp_title)
+        datasets = list(self.iter_all_datasets(fdp_uris))
+        logger.info(f"Total datasets fetched: {len(datasets)}")
+        return datasets
+
+    def iter_all_datasets(self, fdp_uris: List[str]) -> Iterator[Dataset]:
+        """
+        Yield datasets from the given FDPs as each catalog completes.
+
+        FDPs and catalogs share one thread pool: each FDP's catalogs are
+        submitted as soon as that FDP has been fetched, so catalog fetches
+        overlap with slower FDPs instead of waiting for all of them. If the
+        caller stops iterating early, fetches not yet started are cancelled.
+
+        Args:
+            fdp_uris: List of FDP URIs to fetch from.
 
+        Yields:
+            Datasets from all FDPs, in completion order.
+        """
         def _fetch_fdp(uri):
             try:
                 return self.fdp_client.fetch_fdp(uri)
@@ -89,20 +346,7 @@ class DatasetService:
                 logger.warning(f"Failed to fetch FDP {uri}: {e}")
                 return None
 
-        with ThreadPoolExecutor(max_workers=5) as pool:
-            futures = {pool.submit(_fetch_fdp, uri): uri for uri in fdp_uris}
-            for future in as_completed(futures):
-                fdp = future.result()
-                if fdp:
-                    logger.info(f"Fetching datasets from {len(fdp.catalogs)} catalogs in {fdp.title}")
-                    for catalog_uri in fdp.catalogs:
-                        catalog_tasks.append((catalog_uri, fdp.uri, fdp.title))
-
-        # Step 2: fetch all catalogs concurrently
-        datasets = []
-
-        def _fetch_catalog(task):
-            catalog_uri, fdp_uri, fdp_title = task
+        def _fetch_catalog(catalog_uri, fdp_uri, fdp_title):
             try:
                 return self.fdp_client.fetch_catalog_with_datasets(
                     catalog_uri, fdp_uri, fdp_title
@@ -111,16 +355,31 @@ class DatasetService:
                 logger.warning(f"Failed to fetch catalog {catalog_uri}: {e}")
                 return []
 
-        with ThreadPoolExecutor(max_workers=5) as pool:
-            futures = {pool.submit(_fetch_catalog, t): t for t in catalog_tasks}
-            for future in as_completed(futures):
-                datasets.extend(future.result())
-
-        logger.info(f"Total datasets fetched: {len(datasets)}")
-        return datasets
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending = {pool.submit(_fetch_fdp, uri) for uri in fdp_uris}
+            catalog_futures = set()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in catalog_futures:
+                        yield from future.result()
+                        continue
+                    fdp = future.result()
+                    if not fdp:
+                        continue
+                    logger.info(f"Fetching datasets from {len(fdp.catalogs)} catalogs in {fdp.title}")
+                    for catalog_uri in fdp.catalogs:
+                        cf = pool.submit(_fetch_catalog, catalog_uri, fdp.uri, fdp.title)
+                        catalog_futures.add(cf)
+                        pending.add(cf)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
+    @staticmethod
     def filter_by_theme(
-        self, datasets: List[Dataset], theme_uri: str
+        datasets: List[Dataset], theme_uri: str
     ) -> List[Dataset]:
         """
         Filter datasets by theme URI.
@@ -132,16 +391,20 @@ class DatasetService:
         Returns:
             Datasets that have the specified theme.
         """
-        return [ds for ds in datasets if theme_uri in ds.themes]
+        get_themes = _accessor(datasets, _get_themes, 'themes', ())
+        return [ds for ds in datasets if theme_uri in get_themes(ds)]
 
+    @staticmethod
     def filter_by_application(
-        self, datasets: List[Dataset], homepage: str
+        datasets: List[Dataset], homepage: str
     ) -> List[Dataset]:
         """Filter datasets whose catalog shares the given application homepage."""
-        return [ds for ds in datasets if ds.catalog_homepage == homepage]
+        get_homepage = _accessor(datasets, _get_catalog_homepage, 'catalog_homepage')
+        return [ds for ds in datasets if get_homepage(ds) == homepage]
 
+    @staticmethod
     def get_available_applications(
-        self, datasets: List[Dataset]
+        datasets: List[Dataset]
     ) -> List['Application']:
         """Collate datasets by catalog homepage into application groups.
 
@@ -155,13 +418,15 @@ class DatasetService:
         datasets_per_hp: Dict[str, int] = defaultdict(int)
 
         for ds in datasets:
-            hp = ds.catalog_homepage
+            hp = _field(ds, 'catalog_homepage')
             if not hp:
                 continue
-            if ds.catalog_title:
-                titles_per_hp[hp][ds.catalog_title] += 1
-            if ds.fdp_uri:
-                fdps_per_hp[hp].add(ds.fdp_uri)
+            catalog_title = _field(ds, 'catalog_title')
+            if catalog_title:
+                titles_per_hp[hp][catalog_title] += 1
+            fdp_uri = _field(ds, 'fdp_uri')
+            if fdp_uri:
+                fdps_per_hp[hp].add(fdp_uri)
             datasets_per_hp[hp] += 1
 
         apps = []
@@ -180,7 +445,8 @@ class DatasetService:
         apps.sort(key=lambda a: (-a.fdp_count, a.label.lower()))
         return apps
 
-    def search(self, datasets: List[Dataset], query: str) -> List[Dataset]:
+    @staticmethod
+    def search(datasets: List[Dataset], query: str) -> List[Dataset]:
         """
         Full-text search across dataset metadata.
 
@@ -200,50 +466,25 @@ class DatasetService:
         if not query:
             return datasets
 
-        query_lower = query.lower()
+        query_lower = fold_case(query)
         query_terms = query_lower.split()
 
-        scored_results = []
+        def _ranked():
+            for i, ds in enumerate(datasets):
+                score = _score_terms(
+                    query_terms,
+                    fold_case(_field(ds, 'title') or ''),
+                    fold_case(_field(ds, 'description') or ''),
+                    [fold_case(kw) for kw in _field(ds, 'keywords', ())],
+                    [fold_case(tl) for tl in _field(ds, 'theme_labels', ())],
+                )
+                if score > 0:
+                    yield (-score, _field(ds, 'title') or '', i, ds)
 
-        for ds in datasets:
-            score = 0
-            title_lower = (ds.title or '').lower()
-            desc_lower = (ds.description or '').lower()
-            keywords_lower = [kw.lower() for kw in ds.keywords]
-
-            for term in query_terms:
-                # Title match (highest weight)
-                if term in title_lower:
-                    score += 100
-                    # Bonus for exact title match
-                    if title_lower == term:
-                        score += 50
-
-                # Description match
-                if term in desc_lower:
-                    score += 10
-
-                # Keyword match
-                if any(term in kw for kw in keywords_lower):
-                    score += 5
-                    # Bonus for exact keyword match
-                    if term in keywords_lower:
-                        score += 10
-
-                # Theme label match
-                theme_labels_lower = [tl.lower() for tl in ds.theme_labels]
-                if any(term in tl for tl in theme_labels_lower):
-                    score += 5
-
-            if score > 0:
-                scored_results.append((score, ds))
-
-        # Sort by score (descending), then by title
-        scored_results.sort(key=lambda x: (-x[0], x[1].title or ''))
-
-        return [ds for _, ds in scored_results]
-
-    def get_available_themes(self, datasets: List[Dataset]) -> List[Theme]:
+        return _ranked_datasets(_ranked())
+
+    @staticmethod
+    def get_available_themes(datasets: List[Dataset]) -> List[Theme]:
         """
         Extract unique themes from datasets for filter UI.
 
@@ -253,35 +494,24 @@ class DatasetService:
         Returns:
             List of Theme objects with uri, label, and count.
         """
-        theme_counts: Dict[str, Dict[str, Any]] = {}
+        counts: Counter = Counter()
+        labels: Dict[str, str] = {}
+
+        get_themes = _accessor(datasets, _get_themes, 'themes', ())
+        get_theme_labels = _accessor(datasets, _get_theme_labels, 'theme_labels')
 
         for ds in datasets:
-            for i, theme_uri in enumerate(ds.themes):
-                if theme_uri not in theme_counts:
-                    # Try to get a label
-                    label = ''
-                    if i < len(ds.theme_labels):
-                        label = ds.theme_labels[i]
-                    if not label:
-                        # Use the last part of the URI as a fallback label
-                        label = theme_uri.split('/')[-1]
-
-                    theme_counts[theme_uri] = {
-                        'uri': theme_uri,
-                        'label': label,
-                        'count': 0,
-                    }
-
-                theme_counts[theme_uri]['count'] += 1
-
-        # Convert to Theme objects and sort by count (descending)
+            theme_labels = get_theme_labels(ds) or []
+            for i, theme_uri in enumerate(get_themes(ds)):
+                counts[theme_uri] += 1
+                if theme_uri not in labels:
+                    label = theme_labels[i] if i < len(theme_labels) else ''
+                    # Use the last part of the URI as a fallback label
+                    labels[theme_uri] = label or theme_uri.rsplit('/', 1)[-1]
+
         themes = [
-            Theme(
-                uri=data['uri'],
-                label=data['label'],
-                count=data['count'],
-            )
-            for data in theme_counts.values()
+            Theme(uri=uri, label=labels[uri], count=count)
+            for uri, count in counts.items()
         ]
 
         themes.sort(key=lambda t: (-t.count, t.label))
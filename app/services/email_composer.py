@@ -1,5 +1,6 @@
 """Email Composer for generating data access request emails."""
 
+from collections import defaultdict
 from typing import Dict, List
 
 from app.models import DataRequest, DatasetReference, ComposedEmail
@@ -20,15 +21,12 @@ class EmailComposer:
         Returns:
             Dict mapping email addresses to list of datasets.
         """
-        groups: Dict[str, List[DatasetReference]] = {}
+        groups: Dict[str, List[DatasetReference]] = defaultdict(list)
 
         for dataset in request.datasets:
-            email = dataset.contact_email
-            if email not in groups:
-                groups[email] = []
-            groups[email].append(dataset)
+            groups[dataset.contact_email].append(dataset)
 
-        return groups
+        return dict(groups)
 
     def compose_request_email(self, request: DataRequest) -> ComposedEmail:
         """
@@ -44,8 +42,8 @@ class EmailComposer:
         Returns:
             ComposedEmail with subject, body, and recipients.
         """
-        # Collect all unique recipients
-        recipients = list(set(ds.contact_email for ds in request.datasets))
+        # Collect all unique recipients, in the order they first appear
+        recipients = list(dict.fromkeys(ds.contact_email for ds in request.datasets))
 
         # Generate subject
         subject = self._generate_subject(request.datasets)
@@ -102,67 +100,53 @@ class EmailComposer:
         self, request: DataRequest, datasets: List[DatasetReference]
     ) -> str:
         """Generate email body following the template structure."""
-        lines = []
+        orcid_block = (
+            f"ORCID: {request.requester_orcid}\n" if request.requester_orcid else ""
+        )
+        datasets_block = "".join(
+            f"{i}. {ds.title}\n"
+            f"   URI: {ds.uri}\n"
+            f"   Source: {ds.fdp_title}\n"
+            "\n"
+            for i, ds in enumerate(datasets, 1)
+        )
+        constraints_block = (
+            f"== OUTPUT CONSTRAINTS ==\n{request.output_constraints}\n\n"
+            if request.output_constraints else ""
+        )
+        timeline_block = (
+            f"== TIMELINE ==\n{request.timeline}\n\n" if request.timeline else ""
+        )
 
-        # Opening
-        lines.append("Dear Data Steward,")
-        lines.append("")
-        lines.append(
+        return (
+            "Dear Data Steward,\n"
+            "\n"
             "I am writing to request access to data for analysis under a "
-            "data visiting arrangement."
-        )
-        lines.append("")
-
-        # Requester information
-        lines.append("== REQUESTER INFORMATION ==")
-        lines.append(f"Name: {request.requester_name}")
-        lines.append(f"Email: {request.requester_email}")
-        lines.append(f"Affiliation: {request.requester_affiliation}")
-        if request.requester_orcid:
-            lines.append(f"ORCID: {request.requester_orcid}")
-        lines.append("")
-
-        # Requested datasets
-        lines.append("== REQUESTED DATASETS ==")
-        for i, ds in enumerate(datasets, 1):
-            lines.append(f"{i}. {ds.title}")
-            lines.append(f"   URI: {ds.uri}")
-            lines.append(f"   Source: {ds.fdp_title}")
-            lines.append("")
-
-        # Proposed query
-        lines.append("== PROPOSED QUERY ==")
-        lines.append(request.query)
-        lines.append("")
-
-        # Purpose
-        lines.append("== PURPOSE / JUSTIFICATION ==")
-        lines.append(request.purpose)
-        lines.append("")
-
-        # Output constraints (optional)
-        if request.output_constraints:
-            lines.append("== OUTPUT CONSTRAINTS ==")
-            lines.append(request.output_constraints)
-            lines.append("")
-
-        # Timeline (optional)
-        if request.timeline:
-            lines.append("== TIMELINE ==")
-            lines.append(request.timeline)
-            lines.append("")
-
-        # Closing
-        lines.append(
+            "data visiting arrangement.\n"
+            "\n"
+            "== REQUESTER INFORMATION ==\n"
+            f"Name: {request.requester_name}\n"
+            f"Email: {request.requester_email}\n"
+            f"Affiliation: {request.requester_affiliation}\n"
+            f"{orcid_block}"
+            "\n"
+            "== REQUESTED DATASETS ==\n"
+            f"{datasets_block}"
+            "== PROPOSED QUERY ==\n"
+            f"{request.query}\n"
+            "\n"
+            "== PURPOSE / JUSTIFICATION ==\n"
+            f"{request.purpose}\n"
+            "\n"
+            f"{constraints_block}"
+            f"{timeline_block}"
             "I understand that the query will be executed locally on your systems "
             "and only verified/approved results will be returned. Please let me "
-            "know if you require any additional information or documentation."
+            "know if you require any additional information or documentation.\n"
+            "\n"
+            "Thank you for considering this request.\n"
+            "\n"
+            "Best regards,\n"
+            f"{request.requester_name}\n"
+            f"{request.requester_affiliation}"
         )
-        lines.append("")
-        lines.append("Thank you for considering this request.")
-        lines.append("")
-        lines.append("Best regards,")
-        lines.append(request.requester_name)
-        lines.append(request.requester_affiliation)
-
-        return "\n".join(lines)
@@ -1,11 +1,26 @@
 """FDP Client for fetching and parsing FAIR Data Point metadata."""
 
+import copy
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, ReadTimeoutError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from rdflib import Graph, Namespace, URIRef, Literal
 from rdflib.namespace import RDF, RDFS
 
@@ -14,6 +29,22 @@ from app.models import FairDataPoint, Dataset, ContactPoint, Distribution
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent metadata fetches per crawl.
+MAX_FETCH_WORKERS = 16
+
+# Per-catalog fetches of datasets without inline metadata, as many as a
+# single catalog fetch has always used. These run inside the crawl's
+# MAX_FETCH_WORKERS pool; the HTTP connection pool is sized for the product.
+DATASET_FETCH_WORKERS = 5
+
+# Ways FDPClient.fetch_all_from_index can fan out linked FDP fetches.
+PARALLEL_MODES = ('thread', 'process')
+
+# Default budget, in triples across all cached graphs, for parsed documents
+# kept for fresh hits and conditional (ETag/Last-Modified) requests. Graphs
+# vary from a few triples to whole catalogs, so the bound is on their size.
+RDF_CACHE_MAX_TRIPLES = 200_000
+
 
 # RDF Namespaces
 DCAT = Namespace('http://www.w3.org/ns/dcat#')
@@ -25,6 +56,87 @@ LDP = Namespace('http://www.w3.org/ns/ldp#')
 VOID = Namespace('http://rdfs.org/ns/void#')
 SCHEMA = Namespace('https://schema.org/')
 
+# Terms used on hot paths, bound once: attribute access on a Namespace
+# builds a new URIRef on every use.
+DCAT_accessService = DCAT.accessService
+DCAT_accessURL = DCAT.accessURL
+DCAT_byteSize = DCAT.byteSize
+DCAT_contactPoint = DCAT.contactPoint
+DCAT_dataset = DCAT.dataset
+DCAT_distribution = DCAT.distribution
+DCAT_downloadURL = DCAT.downloadURL
+DCAT_endpointDescription = DCAT.endpointDescription
+DCAT_endpointURL = DCAT.endpointURL
+DCAT_keyword = DCAT.keyword
+DCAT_landingPage = DCAT.landingPage
+DCAT_mediaType = DCAT.mediaType
+DCAT_theme = DCAT.theme
+DCT_creator = DCT.creator
+DCT_description = DCT.description
+DCT_format = DCT['format']
+DCT_homepage = DCT.homepage
+DCT_issued = DCT.issued
+DCT_modified = DCT.modified
+DCT_publisher = DCT.publisher
+DCT_title = DCT.title
+FDP_metadataCatalog = FDP.metadataCatalog
+FDP_metadataService = FDP.metadataService
+FOAF_homepage = FOAF.homepage
+FOAF_name = FOAF.name
+LDP_DirectContainer = LDP.DirectContainer
+LDP_contains = LDP.contains
+LDP_membershipResource = LDP.membershipResource
+RDF_type = RDF.type
+RDFS_label = RDFS.label
+SCHEMA_url = SCHEMA.url
+VCARD_fn = VCARD.fn
+VCARD_hasEmail = VCARD.hasEmail
+VCARD_hasURL = VCARD.hasURL
+VOID_sparqlEndpoint = VOID.sparqlEndpoint
+
+# Shared empty result for subjects without properties.
+_NO_PROPERTIES = MappingProxyType({})
+
+
+@lru_cache(maxsize=8192)
+def _uriref(uri: str) -> URIRef:
+    """Return a URIRef for a URI string, memoized.
+
+    Dataset, theme and distribution URIs are converted back to URIRefs for
+    graph lookups on every parse; URIRef construction validates the IRI.
+    """
+    return URIRef(uri)
+
+
+def _expires_at(headers) -> float:
+    """Return the monotonic time until which a response may be reused.
+
+    Based on ``Cache-Control: max-age``; 0 (revalidate on every use) if the
+    header is missing or forbids reuse without revalidation.
+    """
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return 0
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        if name == 'max-age' and value.isdigit():
+            return time.monotonic() + int(value)
+    return 0
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern an optional string shared by many datasets (e.g. publisher)."""
+    return sys.intern(value) if value else value
+
+
+def _intern_all(values: Iterable) -> Tuple[str, ...]:
+    """Return values as a tuple of interned strings.
+
+    Themes and keywords repeat across many datasets; interning makes every
+    dataset share one copy of each string.
+    """
+    return tuple(sys.intern(str(value)) for value in values)
+
 
 def normalize_application_url(url: Optional[str]) -> Optional[str]:
     """Normalize a catalog homepage URL so that trivial variants match.
@@ -76,24 +188,150 @@ class FDPTimeoutError(FDPError):
 class FDPClient:
     """Client for fetching and parsing FAIR Data Point metadata."""
 
-    def __init__(self, timeout: int = 30, verify_ssl: bool = True):
+    def __init__(
+        self,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        parallel_mode: str = 'thread',
+        rdf_cache_triples: int = RDF_CACHE_MAX_TRIPLES,
+        process_workers: Optional[int] = None,
+    ):
         """
         Initialize the FDP client.
 
         Args:
             timeout: Request timeout in seconds.
             verify_ssl: Whether to verify SSL certificates.
+            parallel_mode: ``'thread'`` or ``'process'``; how fetch_all_from_index
+                fetches and parses linked FDPs. Processes parse on all cores
+                when rdflib parsing, not the network, is the bottleneck.
+            rdf_cache_triples: Total triples the RDF cache may hold before
+                evicting least recently used graphs; 0 disables it.
+            process_workers: Worker processes for parallel_mode='process';
+                defaults to the CPU count. Capped at MAX_FETCH_WORKERS.
         """
+        if parallel_mode not in PARALLEL_MODES:
+            raise ValueError(f"parallel_mode must be one of {PARALLEL_MODES}")
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.parallel_mode = parallel_mode
+        self.process_workers = min(process_workers or os.cpu_count() or 1, MAX_FETCH_WORKERS)
         self._headers = {
-            'Accept': 'text/turtle, application/ld+json;q=0.9, application/rdf+xml;q=0.8'
+            'Accept': (
+                'text/turtle, application/hex+x-ndjson;q=0.95, '
+                'application/n-triples;q=0.92, '
+                'application/ld+json;q=0.9, application/rdf+xml;q=0.8'
+            ),
+            # gzip/deflate, plus br (and zstd) when a decoder is installed;
+            # only codings urllib3 can decompress are advertised
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
         }
+        # One pooled session shared by all fetch threads so connections to
+        # the same FDP host are kept alive and reused. Transient gateway
+        # errors are retried with a short backoff; connect errors and
+        # timeouts are not, so a hung FDP fails once, as a timeout. The
+        # backoff ignores Retry-After and is capped so that all retry
+        # sleeps together take at most half the request timeout.
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.verify = verify_ssl
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            # Enough connections for a full crawl against one host
+            pool_maxsize=MAX_FETCH_WORKERS * DATASET_FETCH_WORKERS,
+            max_retries=Retry(
+                total=3,
+                connect=False,
+                read=False,
+                backoff_factor=0.3,
+                backoff_max=timeout / 4,
+                respect_retry_after_header=False,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=['GET'],
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # (uri, Accept) -> (etag, last_modified, graph, expires) in LRU order,
+        # for fresh hits and conditional GETs
+        self._rdf_cache: OrderedDict = OrderedDict()
+        self._rdf_cache_lock = threading.Lock()
+        self._rdf_cache_max_triples = rdf_cache_triples
+        self._rdf_cache_triples = 0
+        # Graph -> subject index, dropped when the graph is garbage collected
+        self._subject_indexes: 'weakref.WeakKeyDictionary[Graph, dict]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._index_lock = threading.Lock()
+        # Worker processes for parallel_mode='process', started on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+        # Set on views from revalidating(): skip max-age hits, own nothing
+        self._revalidate = False
+        self._parent: Optional['FDPClient'] = None
         if not verify_ssl:
             # Suppress InsecureRequestWarning when SSL verification is disabled
             import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+    def clear_cache(self) -> None:
+        """Drop all cached RDF documents."""
+        with self._rdf_cache_lock:
+            self._rdf_cache.clear()
+            self._rdf_cache_triples = 0
+
+    def revalidating(self) -> 'FDPClient':
+        """Return a view of this client for an explicit refresh.
+
+        The view shares the session and RDF cache, but never serves a cached
+        document on max-age freshness alone: every fetch goes to the server,
+        conditionally, so unchanged documents still come back as 304 without
+        re-parsing. Other users' cached documents are left untouched.
+        """
+        view = copy.copy(self)
+        view._revalidate = True
+        view._parent = self._parent or self
+        return view
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and stop any worker processes."""
+        if self._parent is not None:
+            # Views share their parent's resources; the parent closes them
+            return
+        self._session.close()
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(cancel_futures=True)
+                self._process_pool = None
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the long-lived worker pool for parallel_mode='process'.
+
+        Workers are spawned rather than forked, since the pool is started
+        from a multithreaded server process, and each keeps one FDPClient
+        for its connection pool. Worker clients have no RDF cache: this
+        client's clear_cache and revalidating views cannot reach them, so
+        a cached graph there could go stale.
+        """
+        if self._parent is not None:
+            return self._parent._get_process_pool()
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_process_client,
+                    initargs=(self.timeout, self.verify_ssl),
+                )
+            return self._process_pool
+
+    def __enter__(self) -> 'FDPClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _fetch_rdf(self, uri: str) -> Graph:
         """
         Fetch RDF content from a URI and parse it into a Graph.
@@ -109,69 +347,180 @@ class FDPClient:
             FDPTimeoutError: If the request times out.
             FDPParseError: If the RDF cannot be parsed.
         """
+        cache_key = (uri, self._headers['Accept'])
+        with self._rdf_cache_lock:
+            cached = self._rdf_cache.get(cache_key)
+            if cached:
+                self._rdf_cache.move_to_end(cache_key)
+
+        # Serve a document still fresh per its Cache-Control max-age
+        if cached and not self._revalidate and cached[3] > time.monotonic():
+            return cached[2]
+
+        # Revalidate a previously parsed document instead of re-downloading it
+        headers = {}
+        if cached:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        # Stream the body so the parser reads it as it arrives instead of
+        # after buffering the whole document; the connection is released
+        # back to the pool when the response is closed.
         try:
-            response = requests.get(
-                uri, headers=self._headers, timeout=self.timeout, verify=self.verify_ssl
+            response = self._session.get(
+                uri, headers=headers, timeout=self.timeout, verify=self.verify_ssl,
+                stream=True,
             )
-            response.raise_for_status()
         except requests.exceptions.Timeout as e:
             logger.error(f"Timeout fetching {uri}: {e}")
             raise FDPTimeoutError(f"Request to {uri} timed out") from e
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Connection error fetching {uri}: {e}")
             raise FDPConnectionError(f"Could not connect to {uri}") from e
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching {uri}: {e}")
-            raise FDPConnectionError(f"HTTP error for {uri}: {e.response.status_code}") from e
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error fetching {uri}: {e}")
             raise FDPConnectionError(f"Request failed for {uri}") from e
 
-        # Determine format from content-type
-        content_type = response.headers.get('Content-Type', '')
-        if 'turtle' in content_type:
-            rdf_format = 'turtle'
-        elif 'json' in content_type:
-            rdf_format = 'json-ld'
-        elif 'xml' in content_type:
-            rdf_format = 'xml'
-        else:
-            # Default to turtle
-            rdf_format = 'turtle'
+        with response:
+            if response.status_code == 304 and cached:
+                refreshed = (*cached[:3], _expires_at(response.headers))
+                with self._rdf_cache_lock:
+                    self._rdf_cache[cache_key] = refreshed
+                    self._rdf_cache.move_to_end(cache_key)
+                return cached[2]
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"HTTP error fetching {uri}: {e}")
+                raise FDPConnectionError(f"HTTP error for {uri}: {e.response.status_code}") from e
+
+            # Determine format from content-type
+            content_type = response.headers.get('Content-Type', '')
+            if 'turtle' in content_type:
+                rdf_format = 'turtle'
+            elif 'n-triples' in content_type:
+                # Line-based parser; avoids the general notation3 parser
+                rdf_format = 'nt'
+            elif 'hex' in content_type:
+                # Hextuples (NDJSON); rdflib reads it with orjson when installed
+                rdf_format = 'hext'
+            elif 'json' in content_type:
+                rdf_format = 'json-ld'
+            elif 'xml' in content_type:
+                rdf_format = 'xml'
+            else:
+                # Default to turtle
+                rdf_format = 'turtle'
+
+            # Parse the raw bytes (gzip/deflate undone by urllib3): skips
+            # decoding the body to str first, and lets the RDF/XML parser
+            # honour the document's declared encoding. Relative IRIs resolve
+            # against the document URI, as RFC 3986 requires; parsing a
+            # string instead resolved them against the server's working
+            # directory (file:///...).
+            response.raw.decode_content = True
+            try:
+                graph = Graph()
+                graph.parse(source=response.raw, format=rdf_format, publicID=uri)
+            except ReadTimeoutError as e:
+                logger.error(f"Timeout reading {uri}: {e}")
+                raise FDPTimeoutError(f"Request to {uri} timed out") from e
+            except (Urllib3HTTPError, requests.exceptions.RequestException) as e:
+                logger.error(f"Connection error reading {uri}: {e}")
+                raise FDPConnectionError(f"Could not read {uri}") from e
+            except Exception as e:
+                logger.error(f"Parse error for {uri}: {e}")
+                raise FDPParseError(f"Could not parse RDF from {uri}") from e
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        expires = _expires_at(response.headers)
+        no_store = 'no-store' in response.headers.get('Cache-Control', '').lower()
+        size = len(graph)
+        if (
+            (etag or last_modified or expires)
+            and not no_store
+            and size <= self._rdf_cache_max_triples
+        ):
+            with self._rdf_cache_lock:
+                replaced = self._rdf_cache.pop(cache_key, None)
+                if replaced:
+                    self._rdf_cache_triples -= len(replaced[2])
+                self._rdf_cache[cache_key] = (etag, last_modified, graph, expires)
+                self._rdf_cache_triples += size
+                while self._rdf_cache_triples > self._rdf_cache_max_triples:
+                    _, evicted = self._rdf_cache.popitem(last=False)
+                    self._rdf_cache_triples -= len(evicted[2])
+        return graph
+
+    def _subject_index(self, graph: Graph) -> Dict[Any, Dict[URIRef, list]]:
+        """Return ``subject -> predicate -> [objects]`` for a graph.
+
+        Built in one pass over the graph's triples the first time a graph is
+        read and kept for as long as the graph is alive (parsed graphs are
+        shared through the RDF cache), so each later property lookup is a
+        plain dict access instead of an rdflib store traversal.
+        """
+        with self._index_lock:
+            index = self._subject_indexes.get(graph)
+        if index is None:
+            index = defaultdict(dict)
+            for subject, predicate, obj in graph:
+                index[subject].setdefault(predicate, []).append(obj)
+            index = dict(index)
+            with self._index_lock:
+                self._subject_indexes[graph] = index
+        return index
+
+    def _predicate_objects(self, graph: Graph, subject: URIRef) -> Dict[URIRef, list]:
+        """Return all objects of a subject grouped by predicate.
+
+        Lets the fetch_* methods read many properties of one resource without
+        a separate index lookup per predicate. The returned dict is shared
+        and must not be modified.
+        """
+        return self._subject_index(graph).get(subject, _NO_PROPERTIES)
 
-        try:
-            graph = Graph()
-            graph.parse(data=response.text, format=rdf_format)
-            return graph
-        except Exception as e:
-            logger.error(f"Parse error for {uri}: {e}")
-            raise FDPParseError(f"Could not parse RDF from {uri}") from e
-
-    def _get_literal_value(
-        self, graph: Graph, subject: URIRef, predicate: URIRef
-    ) -> Optional[str]:
-        """Extract a literal value from the graph."""
-        for obj in graph.objects(subject, predicate):
+    def _ldp_members(self, graph: Graph) -> Dict[Any, list]:
+        """Map each LDP DirectContainer's membership resource to its contents.
+
+        Built from the subject index in one pass, instead of a store lookup
+        for the membership resource and contents of every container.
+        """
+        members: Dict[Any, list] = {}
+        for props in self._subject_index(graph).values():
+            if LDP_DirectContainer not in props.get(RDF_type, ()):
+                continue
+            for membership_resource in props.get(LDP_membershipResource, ())[:1]:
+                members.setdefault(membership_resource, []).extend(
+                    props.get(LDP_contains, ())
+                )
+        return members
+
+    def _literal_from(self, graph: Graph, objects: Iterable) -> Optional[str]:
+        """Return the first literal value (or label of a URI) among objects."""
+        for obj in objects:
             if isinstance(obj, Literal):
                 return str(obj)
             elif isinstance(obj, URIRef):
-                # Try to get label for URI
-                for label in graph.objects(obj, RDFS.label):
+                # Try to get label for URI, or its foaf:name
+                props = self._predicate_objects(graph, obj)
+                for label in props.get(RDFS_label) or props.get(FOAF_name, ()):
                     return str(label)
-                # Or get foaf:name
-                for name in graph.objects(obj, FOAF.name):
-                    return str(name)
         return None
 
-    def _get_uri_list(
-        self, graph: Graph, subject: URIRef, predicate: URIRef
-    ) -> List[str]:
-        """Extract a list of URI values from the graph."""
-        uris = []
-        for obj in graph.objects(subject, predicate):
-            if isinstance(obj, URIRef):
-                uris.append(str(obj))
-        return uris
+    @staticmethod
+    def _uris_from(objects: Iterable) -> List[str]:
+        """Return the URI values among objects as strings."""
+        return [str(obj) for obj in objects if isinstance(obj, URIRef)]
+
+    @staticmethod
+    def _first_str(objects: Optional[list]) -> Optional[str]:
+        """Return the first of objects as a string, or None if empty."""
+        return str(objects[0]) if objects else None
 
     def _extract_contact_point(
         self, graph: Graph, dataset_uri: URIRef
@@ -186,7 +535,8 @@ class FDPClient:
         Returns:
             A ContactPoint instance if found, None otherwise.
         """
-        for contact_node in graph.objects(dataset_uri, DCAT.contactPoint):
+        contact_nodes = self._predicate_objects(graph, dataset_uri).get(DCAT_contactPoint, ())
+        for contact_node in contact_nodes:
             # Handle plain literal contact point (e.g. dcat:contactPoint "user@example.com")
             if isinstance(contact_node, Literal):
                 value = str(contact_node).strip()
@@ -197,30 +547,15 @@ class FDPClient:
                 else:
                     return ContactPoint(name=value)
 
-            # Handle structured vCard contact point (blank node or URI)
-            name = None
-            email = None
-            url = None
-
-            # Get name (vcard:fn)
-            for fn in graph.objects(contact_node, VCARD.fn):
-                name = str(fn)
-                break
-
-            # Get email (vcard:hasEmail)
-            for email_node in graph.objects(contact_node, VCARD.hasEmail):
-                email_str = str(email_node)
+            # Handle structured vCard contact point (blank node or URI),
+            # reading its properties in one scan
+            props = self._predicate_objects(graph, contact_node)
+            name = self._first_str(props.get(VCARD_fn))
+            email = self._first_str(props.get(VCARD_hasEmail))
+            if email:
                 # Handle mailto: URIs
-                if email_str.startswith('mailto:'):
-                    email = email_str[7:]
-                else:
-                    email = email_str
-                break
-
-            # Get URL (vcard:hasURL)
-            for url_node in graph.objects(contact_node, VCARD.hasURL):
-                url = str(url_node)
-                break
+                email = email.removeprefix('mailto:')
+            url = self._first_str(props.get(VCARD_hasURL))
 
             if name or email or url:
                 return ContactPoint(name=name, email=email, url=url)
@@ -228,20 +563,25 @@ class FDPClient:
         return None
 
     def _parse_date(self, value: Optional[str]) -> Optional[datetime]:
-        """Parse a date string to datetime."""
+        """Parse a date string to datetime.
+
+        Since Python 3.11 ``datetime.fromisoformat`` (implemented in C)
+        accepts date-only values and a trailing ``Z``, so no slower
+        ``strptime`` fallback is needed.
+        """
         if not value:
             return None
         try:
-            # Try ISO format first
-            return datetime.fromisoformat(value.replace('Z', '+00:00'))
-        except ValueError:
-            pass
-        try:
-            # Try date only format
-            return datetime.strptime(value, '%Y-%m-%d')
+            return datetime.fromisoformat(value)
         except ValueError:
-            pass
-        return None
+            return None
+
+    def _iso_date(self, value: Optional[str]) -> Optional[str]:
+        """Return an ISO-8601 date literal as-is if it parses, else None.
+
+        Datasets keep dates as strings; ISO-8601 sorts chronologically.
+        """
+        return value if self._parse_date(value) else None
 
     def fetch_fdp(self, uri: str) -> FairDataPoint:
         """
@@ -264,55 +604,46 @@ class FDPClient:
         fdp_uri = URIRef(normalized_uri)
         fdp_uri_with_slash = URIRef(normalized_uri + '/')
 
-        # Get title - try both URI forms
-        title = self._get_literal_value(graph, fdp_uri, DCT.title)
-        if not title:
-            title = self._get_literal_value(graph, fdp_uri_with_slash, DCT.title)
-        if not title:
-            title = self._get_literal_value(graph, fdp_uri, RDFS.label)
-        if not title:
-            title = self._get_literal_value(graph, fdp_uri_with_slash, RDFS.label)
-        if not title:
-            title = uri
-
-        # Get description - try both URI forms
-        description = self._get_literal_value(graph, fdp_uri, DCT.description)
-        if not description:
-            description = self._get_literal_value(graph, fdp_uri_with_slash, DCT.description)
-
-        # Get publisher - try both URI forms
-        publisher = self._get_literal_value(graph, fdp_uri, DCT.publisher)
-        if not publisher:
-            publisher = self._get_literal_value(graph, fdp_uri_with_slash, DCT.publisher)
+        # Read the properties of whichever URI form the graph describes,
+        # preferring the form without a slash
+        subject = fdp_uri if (fdp_uri, None, None) in graph else fdp_uri_with_slash
+        props = self._predicate_objects(graph, subject)
+
+        def _literal(predicate):
+            return self._literal_from(graph, props.get(predicate, ()))
+
+        def _uris(predicate):
+            return self._uris_from(props.get(predicate, ()))
+
+        title = _literal(DCT_title) or _literal(RDFS_label) or uri
+        description = _literal(DCT_description)
+        publisher = _literal(DCT_publisher)
 
         # Get catalogs (via fdp:metadataCatalog or ldp:DirectContainer)
-        # Try both URI forms
-        catalogs = self._get_uri_list(graph, fdp_uri, FDP.metadataCatalog)
-        if not catalogs:
-            catalogs = self._get_uri_list(graph, fdp_uri_with_slash, FDP.metadataCatalog)
+        catalogs = _uris(FDP_metadataCatalog)
         logger.info(f"Found {len(catalogs)} catalogs via fdp:metadataCatalog for {uri}")
 
         # Also check for catalogs in LDP DirectContainer
         # Look for any ldp:DirectContainer that has this FDP as membershipResource
-        for container in graph.subjects(RDF.type, LDP.DirectContainer):
-            membership_resource = graph.value(container, LDP.membershipResource)
-            # Check both URI forms
-            if membership_resource == fdp_uri or membership_resource == fdp_uri_with_slash:
-                # Get all catalogs from ldp:contains
-                ldp_catalogs = self._get_uri_list(graph, container, LDP.contains)
-                logger.info(f"Found {len(ldp_catalogs)} catalogs via LDP DirectContainer for {uri}")
-                # Add any new catalogs not already in the list
-                for cat in ldp_catalogs:
-                    if cat not in catalogs:
-                        catalogs.append(cat)
+        ldp_members = self._ldp_members(graph)
+        seen = set(catalogs)
+        # Check both URI forms
+        for fdp_subject in (fdp_uri, fdp_uri_with_slash):
+            if fdp_subject not in ldp_members:
+                continue
+            # Get all catalogs from ldp:contains
+            ldp_catalogs = self._uris_from(ldp_members[fdp_subject])
+            logger.info(f"Found {len(ldp_catalogs)} catalogs via LDP DirectContainer for {uri}")
+            # Add any new catalogs not already in the list
+            for cat in ldp_catalogs:
+                if cat not in seen:
+                    seen.add(cat)
+                    catalogs.append(cat)
 
         logger.info(f"Total catalogs discovered for {uri}: {len(catalogs)}")
 
         # Check if this is an index FDP (has fdp:metadataService links)
-        # Try both URI forms
-        linked_fdps = self._get_uri_list(graph, fdp_uri, FDP.metadataService)
-        if not linked_fdps:
-            linked_fdps = self._get_uri_list(graph, fdp_uri_with_slash, FDP.metadataService)
+        linked_fdps = _uris(FDP_metadataService)
         is_index = len(linked_fdps) > 0
 
         return FairDataPoint(
@@ -346,18 +677,19 @@ class FDPClient:
         datasets = []
 
         # Get catalog title for context
-        catalog_uri_ref = URIRef(catalog_uri)
-        catalog_title = self._get_literal_value(graph, catalog_uri_ref, DCT.title)
+        catalog_uri_ref = _uriref(catalog_uri)
+        catalog_props = self._predicate_objects(graph, catalog_uri_ref)
+        catalog_title = self._literal_from(graph, catalog_props.get(DCT_title, ()))
         if not catalog_title:
-            catalog_title = self._get_literal_value(graph, catalog_uri_ref, RDFS.label)
+            catalog_title = self._literal_from(graph, catalog_props.get(RDFS_label, ()))
         if not catalog_title:
             catalog_title = catalog_uri.split('/')[-1]  # Use last part of URI as fallback
 
         # Try several predicates for the application homepage. Normalized so
         # catalogs hosted on different FDPs can be grouped as one application.
         catalog_homepage = None
-        for predicate in (FOAF.homepage, DCT.homepage, SCHEMA.url, DCAT.landingPage):
-            for obj in graph.objects(catalog_uri_ref, predicate):
+        for predicate in (FOAF_homepage, DCT_homepage, SCHEMA_url, DCAT_landingPage):
+            for obj in catalog_props.get(predicate, ()):
                 candidate = str(obj).strip()
                 if candidate:
                     catalog_homepage = candidate
@@ -366,39 +698,32 @@ class FDPClient:
                 break
         catalog_homepage = normalize_application_url(catalog_homepage)
 
-        # Find all datasets in the catalog
-        dataset_uris = set()
-
-        # Method 1: dcat:dataset
-        for ds_uri in graph.objects(catalog_uri_ref, DCAT.dataset):
-            dataset_uris.add(str(ds_uri))
-
-        # Method 2: LDP DirectContainer
-        for container in graph.subjects(RDF.type, LDP.DirectContainer):
-            membership_resource = graph.value(container, LDP.membershipResource)
-            if membership_resource == catalog_uri_ref:
-                for ds_uri in graph.objects(container, LDP.contains):
-                    dataset_uris.add(str(ds_uri))
+        # Find all datasets in the catalog, de-duplicated in discovery order
+        dataset_uris = dict.fromkeys(chain(
+            # Method 1: dcat:dataset
+            map(str, catalog_props.get(DCAT_dataset, ())),
+            # Method 2: LDP DirectContainer
+            map(str, self._ldp_members(graph).get(catalog_uri_ref, ())),
+        ))
 
         # Extract metadata for each dataset from the catalog graph
         needs_fetch = []
         for ds_uri_str in dataset_uris:
-            ds_uri = URIRef(ds_uri_str)
+            ds_uri = _uriref(ds_uri_str)
 
             # Try to extract metadata from the catalog graph (inline)
-            title = self._get_literal_value(graph, ds_uri, DCT.title)
+            props = self._predicate_objects(graph, ds_uri)
+            title = self._literal_from(graph, props.get(DCT_title, ()))
 
             if title:
                 # Catalog has inline metadata — use it
-                description = self._get_literal_value(graph, ds_uri, DCT.description)
-                publisher = self._get_literal_value(graph, ds_uri, DCT.publisher)
-                creator = self._get_literal_value(graph, ds_uri, DCT.creator)
-                themes = self._get_uri_list(graph, ds_uri, DCAT.theme)
-                keywords = []
-                for kw in graph.objects(ds_uri, DCAT.keyword):
-                    keywords.append(str(kw))
+                description = self._literal_from(graph, props.get(DCT_description, ()))
+                publisher = _intern(self._literal_from(graph, props.get(DCT_publisher, ())))
+                creator = _intern(self._literal_from(graph, props.get(DCT_creator, ())))
+                themes = _intern_all(self._uris_from(props.get(DCAT_theme, ())))
+                keywords = _intern_all(props.get(DCAT_keyword, ()))
                 contact_point = self._extract_contact_point(graph, ds_uri)
-                landing_page = self._get_literal_value(graph, ds_uri, DCAT.landingPage)
+                landing_page = self._literal_from(graph, props.get(DCAT_landingPage, ()))
 
                 dataset = Dataset(
                     uri=ds_uri_str,
@@ -439,7 +764,8 @@ class FDPClient:
                         fdp_uri=fdp_uri, fdp_title=fdp_title,
                     )
 
-            with ThreadPoolExecutor(max_workers=5) as pool:
+            workers = min(DATASET_FETCH_WORKERS, len(needs_fetch))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
                 futures = {pool.submit(_fetch_one, uri): uri for uri in needs_fetch}
                 for future in as_completed(futures):
                     datasets.append(future.result())
@@ -467,57 +793,51 @@ class FDPClient:
             FDPParseError: If RDF cannot be parsed.
         """
         graph = self._fetch_rdf(uri)
-        dataset_uri = URIRef(uri)
+        dataset_uri = _uriref(uri)
 
-        # Get title
-        title = self._get_literal_value(graph, dataset_uri, DCT.title)
-        if not title:
-            title = self._get_literal_value(graph, dataset_uri, RDFS.label)
-        if not title:
-            title = uri
+        # Collect all of the dataset's properties in one scan
+        props = self._predicate_objects(graph, dataset_uri)
 
-        # Get description
-        description = self._get_literal_value(graph, dataset_uri, DCT.description)
+        def _literal(predicate):
+            return self._literal_from(graph, props.get(predicate, ()))
 
-        # Get publisher
-        publisher = self._get_literal_value(graph, dataset_uri, DCT.publisher)
+        # Get title
+        title = _literal(DCT_title) or _literal(RDFS_label) or uri
 
-        # Get creator
-        creator = self._get_literal_value(graph, dataset_uri, DCT.creator)
+        description = _literal(DCT_description)
+        publisher = _intern(_literal(DCT_publisher))
+        creator = _intern(_literal(DCT_creator))
 
         # Get dates
-        issued_str = self._get_literal_value(graph, dataset_uri, DCT.issued)
-        issued = self._parse_date(issued_str)
-
-        modified_str = self._get_literal_value(graph, dataset_uri, DCT.modified)
-        modified = self._parse_date(modified_str)
+        issued = self._iso_date(_literal(DCT_issued))
+        modified = self._iso_date(_literal(DCT_modified))
 
         # Get themes
-        themes = self._get_uri_list(graph, dataset_uri, DCAT.theme)
+        themes = _intern_all(self._uris_from(props.get(DCAT_theme, ())))
 
-        # Get theme labels
+        # Get theme labels (first literal rdfs:label) from the subject index
         theme_labels = []
         for theme_uri in themes:
-            label = self._get_literal_value(graph, URIRef(theme_uri), RDFS.label)
-            if label:
-                theme_labels.append(label)
+            theme_props = self._predicate_objects(graph, _uriref(theme_uri))
+            for label in theme_props.get(RDFS_label, ()):
+                if isinstance(label, Literal) and str(label):
+                    theme_labels.append(sys.intern(str(label)))
+                    break
 
         # Get keywords
-        keywords = []
-        for keyword in graph.objects(dataset_uri, DCAT.keyword):
-            keywords.append(str(keyword))
+        keywords = _intern_all(props.get(DCAT_keyword, ()))
 
         # Get contact point
         contact_point = self._extract_contact_point(graph, dataset_uri)
 
         # Get landing page
         landing_page = None
-        for lp in graph.objects(dataset_uri, DCAT.landingPage):
+        for lp in props.get(DCAT_landingPage, ()):
             landing_page = str(lp)
             break
 
         # Get distributions - fetch full metadata for each
-        distribution_uris = self._get_uri_list(graph, dataset_uri, DCAT.distribution)
+        distribution_uris = self._uris_from(props.get(DCAT_distribution, ()))
         distributions = []
         for dist_uri in distribution_uris:
             # First try to extract from the same graph (inline distributions)
@@ -549,48 +869,56 @@ class FDPClient:
             distributions=distributions,
         )
 
-    def _is_sparql_endpoint(self, graph: Graph, node: URIRef) -> bool:
-        """Check if a resource is a SPARQL endpoint based on RDF type or properties."""
+    def _is_sparql_endpoint(
+        self, graph: Graph, node: URIRef, props: Optional[Dict[URIRef, list]] = None
+    ) -> bool:
+        """Check if a resource is a SPARQL endpoint based on RDF type or properties.
+
+        ``props`` may hold the node's already collected ``_predicate_objects``.
+        """
+        if props is None:
+            props = self._predicate_objects(graph, node)
+
         # Check rdf:type for dcat:DataService
-        for rdf_type in graph.objects(node, RDF.type):
-            type_str = str(rdf_type)
-            if 'DataService' in type_str:
+        for rdf_type in props.get(RDF_type, ()):
+            if 'DataService' in str(rdf_type):
                 return True
 
-        # Check for void:sparqlEndpoint
-        for _ in graph.objects(node, VOID.sparqlEndpoint):
-            return True
-
-        # Check for dcat:endpointURL (strong signal)
-        for _ in graph.objects(node, DCAT.endpointURL):
+        # Check for void:sparqlEndpoint or dcat:endpointURL (strong signals)
+        if props.get(VOID_sparqlEndpoint) or props.get(DCAT_endpointURL):
             return True
 
-        # Heuristic: check if endpoint URL or access URL contains sparql-like patterns
-        for prop in [DCAT.endpointURL, DCAT.accessURL]:
-            for url_node in graph.objects(node, prop):
-                url_str = str(url_node).lower()
-                if any(hint in url_str for hint in ['sparql', 'repositories', 'allegrograph']):
-                    return True
+        # Heuristic: check if access URL contains sparql-like patterns
+        for url_node in props.get(DCAT_accessURL, ()):
+            url_str = str(url_node).lower()
+            if any(hint in url_str for hint in ['sparql', 'repositories', 'allegrograph']):
+                return True
 
         return False
 
-    def _extract_endpoint_url(self, graph: Graph, node: URIRef) -> Optional[str]:
-        """Extract endpoint URL from a distribution or data service."""
-        # Try dcat:endpointURL first (most specific)
-        for url in graph.objects(node, DCAT.endpointURL):
-            return str(url)
+    def _extract_endpoint_url(
+        self, graph: Graph, node: URIRef, props: Optional[Dict[URIRef, list]] = None
+    ) -> Optional[str]:
+        """Extract endpoint URL from a distribution or data service.
+
+        ``props`` may hold the node's already collected ``_predicate_objects``.
+        """
+        if props is None:
+            props = self._predicate_objects(graph, node)
 
-        # Try void:sparqlEndpoint
-        for url in graph.objects(node, VOID.sparqlEndpoint):
-            return str(url)
+        # Try dcat:endpointURL first (most specific), then void:sparqlEndpoint
+        url = (self._first_str(props.get(DCAT_endpointURL))
+               or self._first_str(props.get(VOID_sparqlEndpoint)))
+        if url:
+            return url
 
         # Check if this distribution links to a dcat:accessService with an endpoint
-        for service in graph.objects(node, DCAT.accessService):
-            for url in graph.objects(service, DCAT.endpointURL):
+        for service in props.get(DCAT_accessService, ()):
+            for url in self._predicate_objects(graph, service).get(DCAT_endpointURL, ()):
                 return str(url)
 
         # Fallback: use accessURL if it looks like a SPARQL endpoint
-        for url in graph.objects(node, DCAT.accessURL):
+        for url in props.get(DCAT_accessURL, ()):
             url_str = str(url).lower()
             if any(hint in url_str for hint in ['sparql', 'repositories', 'allegrograph']):
                 return str(url)
@@ -615,32 +943,28 @@ class FDPClient:
                 # Return minimal distribution if fetch fails
                 return Distribution(uri=uri)
 
-        dist_uri = URIRef(uri)
+        dist_uri = _uriref(uri)
 
-        title = self._get_literal_value(graph, dist_uri, DCT.title)
-        if not title:
-            title = self._get_literal_value(graph, dist_uri, RDFS.label)
+        # Collect all of the distribution's properties in one scan
+        props = self._predicate_objects(graph, dist_uri)
 
-        description = self._get_literal_value(graph, dist_uri, DCT.description)
+        def _literal(predicate):
+            return self._literal_from(graph, props.get(predicate, ()))
 
-        # Access URLs
-        access_url = None
-        for url in graph.objects(dist_uri, DCAT.accessURL):
-            access_url = str(url)
-            break
+        title = _literal(DCT_title) or _literal(RDFS_label)
+        description = _literal(DCT_description)
 
-        download_url = None
-        for url in graph.objects(dist_uri, DCAT.downloadURL):
-            download_url = str(url)
-            break
+        # Access URLs
+        access_url = self._first_str(props.get(DCAT_accessURL))
+        download_url = self._first_str(props.get(DCAT_downloadURL))
 
         # Media type and format
-        media_type = self._get_literal_value(graph, dist_uri, DCAT.mediaType)
-        dist_format = self._get_literal_value(graph, dist_uri, DCT['format'])
+        media_type = _literal(DCAT_mediaType)
+        dist_format = _literal(DCT_format)
 
         # Byte size
         byte_size = None
-        size_val = self._get_literal_value(graph, dist_uri, DCAT.byteSize)
+        size_val = _literal(DCAT_byteSize)
         if size_val:
             try:
                 byte_size = int(size_val)
@@ -648,11 +972,9 @@ class FDPClient:
                 pass
 
         # SPARQL endpoint detection
-        endpoint_url = self._extract_endpoint_url(graph, dist_uri)
-        endpoint_description = self._get_literal_value(
-            graph, dist_uri, DCAT.endpointDescription
-        )
-        is_sparql = self._is_sparql_endpoint(graph, dist_uri)
+        endpoint_url = self._extract_endpoint_url(graph, dist_uri, props)
+        endpoint_description = _literal(DCAT_endpointDescription)
+        is_sparql = self._is_sparql_endpoint(graph, dist_uri, props)
 
         # If we found an endpoint URL but didn't detect SPARQL, mark it anyway
         if endpoint_url and not is_sparql:
@@ -697,23 +1019,50 @@ class FDPClient:
         index_fdp = self.fetch_fdp(index_uri)
         result = [index_fdp]
 
-        # Then fetch all linked FDPs
-        for linked_uri in index_fdp.linked_fdps:
-            try:
-                linked_fdp = self.fetch_fdp(linked_uri)
-                result.append(linked_fdp)
-                logger.info(f"Successfully fetched linked FDP: {linked_uri}")
-            except FDPError as e:
-                # Log error but continue with other FDPs
-                logger.warning(f"Failed to fetch linked FDP {linked_uri}: {e}")
-                # Add a placeholder FDP with error status
-                error_fdp = FairDataPoint(
-                    uri=linked_uri,
-                    title=linked_uri,
-                    is_index=False,
-                    status='error',
-                    error_message=str(e),
-                )
-                result.append(error_fdp)
+        # Then fetch all linked FDPs concurrently, keeping their order; an
+        # FDP listed twice (or the index listing itself) is fetched once
+        linked = [
+            uri for uri in dict.fromkeys(index_fdp.linked_fdps) if uri != index_uri
+        ]
+        if linked and self.parallel_mode == 'process':
+            # Each worker parses with its own client; only the resulting
+            # FairDataPoint dataclasses cross the process boundary.
+            result.extend(self._get_process_pool().map(_fetch_fdp_in_process, linked))
+        elif linked:
+            workers = min(MAX_FETCH_WORKERS, len(linked))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                result.extend(pool.map(self._safe_fetch_fdp, linked))
 
         return result
+
+    def _safe_fetch_fdp(self, uri: str) -> FairDataPoint:
+        """Fetch an FDP, returning a placeholder with error status on failure."""
+        try:
+            fdp = self.fetch_fdp(uri)
+            logger.info(f"Successfully fetched linked FDP: {uri}")
+            return fdp
+        except FDPError as e:
+            # Log error but continue with other FDPs
+            logger.warning(f"Failed to fetch linked FDP {uri}: {e}")
+            return FairDataPoint(
+                uri=uri,
+                title=uri,
+                is_index=False,
+                status='error',
+                error_message=str(e),
+            )
+
+
+# The FDPClient of the current worker process, set by _init_process_client.
+_process_client: Optional[FDPClient] = None
+
+
+def _init_process_client(timeout: int, verify_ssl: bool) -> None:
+    """Create the client a worker process reuses for all of its fetches."""
+    global _process_client
+    _process_client = FDPClient(timeout=timeout, verify_ssl=verify_ssl, rdf_cache_triples=0)
+
+
+def _fetch_fdp_in_process(uri: str) -> FairDataPoint:
+    """Fetch one FDP in a worker process (top-level so it can be pickled)."""
+    return _process_client._safe_fetch_fdp(uri)
@@ -1,15 +1,197 @@
 """Shared utility functions for the fairdataspace application."""
 
 import hashlib
+from functools import lru_cache
 
+import msgspec
+from cachelib import FileSystemCache
+from cachelib.serializers import FileSystemSerializer
+from flask import current_app
 
+
+@lru_cache(maxsize=8192)
 def get_uri_hash(uri: str) -> str:
-    """Generate MD5 hash of URI for use as identifier.
+    """Generate a short BLAKE2b hash of URI for use as identifier.
+
+    Results are memoized since the same dataset and FDP URIs are hashed
+    on nearly every request.
 
     Args:
         uri: The URI to hash.
 
     Returns:
-        Hex digest of the MD5 hash.
+        16-character hex digest of the BLAKE2b hash.
+    """
+    return hashlib.blake2b(uri.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# Length of the MD5 hex digests used as identifiers before the switch to BLAKE2b.
+LEGACY_URI_HASH_LENGTH = 32
+
+
+def migrate_legacy_uri_hashes(session) -> None:
+    """Rewrite MD5-era URI hashes stored in a session to the current scheme.
+
+    Sessions created before the switch to BLAKE2b key ``fdps``,
+    ``discovered_endpoints`` and ``endpoint_credentials`` by MD5 digests and
+    store them on basket items. Those are re-keyed in place and the dataset
+    cache is dropped so it is rebuilt with the new hashes on next access.
+
+    Args:
+        session: The Flask session to migrate.
+    """
+    fdps = session.get('fdps') or {}
+    discovered = session.get('discovered_endpoints') or {}
+    if not any(len(key) == LEGACY_URI_HASH_LENGTH for key in (*fdps, *discovered)):
+        return
+
+    rekeyed = {}
+    for old_key, fdp in fdps.items():
+        rekeyed[old_key] = get_uri_hash(fdp['uri'])
+    for old_key, ep in discovered.items():
+        rekeyed[old_key] = get_uri_hash(ep['endpoint_url'])
+
+    session['fdps'] = {rekeyed[k]: v for k, v in fdps.items()}
+    session['discovered_endpoints'] = {rekeyed[k]: v for k, v in discovered.items()}
+    session['endpoint_credentials'] = {
+        rekeyed.get(k, k): v
+        for k, v in (session.get('endpoint_credentials') or {}).items()
+    }
+    for item in session.get('basket') or []:
+        item['uri_hash'] = get_uri_hash(item['uri'])
+    session.pop('datasets_cache', None)
+    session.pop('datasets_cache_key', None)
+    session.modified = True
+
+
+def get_fdp_client():
+    """Return the application-scoped FDPClient created in ``create_app``.
+
+    Returns:
+        The shared FDPClient instance.
+    """
+    return current_app.extensions['fdp_client']
+
+
+class MsgpackSerializer(FileSystemSerializer):
+    """Store cache entries as MessagePack instead of pickle.
+
+    Cached datasets are plain dicts and lists, which msgspec encodes faster
+    and more compactly than pickle.
+    """
+
+    _encoder = msgspec.msgpack.Encoder()
+    _decoder = msgspec.msgpack.Decoder()
+
+    def dump(self, value, f, protocol=None) -> None:
+        f.write(self._encoder.encode(value))
+
+    def load(self, f):
+        try:
+            return self._decoder.decode(f.read())
+        except msgspec.DecodeError as e:
+            self._warn(e)
+            return None
+
+
+class DatasetCache(FileSystemCache):
+    """Filesystem cache for dataset listings, serialised with MessagePack."""
+
+    serializer = MsgpackSerializer()
+
+
+def get_dataset_cache():
+    """Return the application-scoped server-side dataset cache.
+
+    Returns:
+        The cachelib cache created in ``create_app``.
+    """
+    return current_app.extensions['dataset_cache']
+
+
+def get_basket_uris(session) -> set:
+    """Return the URIs of the datasets in the basket as a set.
+
+    ``session['basket_uris']`` mirrors the basket so membership checks do not
+    sweep the basket items; it is derived from the basket if missing.
+
+    Args:
+        session: The Flask session holding the basket.
+
+    Returns:
+        Set of dataset URIs currently in the basket.
+    """
+    uris = session.get('basket_uris')
+    if uris is None:
+        uris = [item['uri'] for item in session.get('basket', [])]
+    return set(uris)
+
+
+def set_basket(session, basket: list) -> None:
+    """Store the basket with its URI list and missing-contact titles.
+
+    Args:
+        session: The Flask session to update.
+        basket: The basket items to store.
+    """
+    session['basket'] = basket
+    session['basket_uris'] = [item['uri'] for item in basket]
+    session['basket_missing_contacts'] = _missing_contacts(basket)
+    session.modified = True
+
+
+def _missing_contacts(basket: list) -> list:
+    """Titles of basket items that have no contact email."""
+    return [
+        item['title'] for item in basket
+        if not (item.get('contact_point') or {}).get('email')
+    ]
+
+
+def get_missing_contacts(session) -> list:
+    """Return the titles of basket datasets without a contact email.
+
+    Read from ``session['basket_missing_contacts']``, which ``set_basket``
+    keeps up to date; derived from the basket if missing.
+
+    Args:
+        session: The Flask session holding the basket.
+
+    Returns:
+        List of dataset titles.
+    """
+    missing = session.get('basket_missing_contacts')
+    if missing is None:
+        missing = _missing_contacts(session.get('basket', []))
+    return missing
+
+
+def set_if_changed(session, key: str, value) -> bool:
+    """Store a session value only if it differs from the current one.
+
+    Writing to the session marks it modified, which makes the backend
+    re-serialise and save it. Skipping no-op writes avoids that work.
+
+    Args:
+        session: The Flask session to update.
+        key: The session key.
+        value: The new value.
+
+    Returns:
+        True if the session was updated.
+    """
+    if key in session and session[key] == value:
+        return False
+    session[key] = value
+    return True
+
+
+def pop_if_present(session, key: str) -> None:
+    """Remove a session key without marking the session modified if absent.
+
+    Args:
+        session: The Flask session to update.
+        key: The session key to remove.
     """
-    return hashlib.md5(uri.encode()).hexdigest()
+    if key in session:
+        session.pop(key)
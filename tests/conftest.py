@@ -24,11 +24,16 @@ FIXTURES_DIR = Path(__file__).parent / 'fixtures'
 
 
 @pytest.fixture
-def app():
+def app(tmp_path):
     """Create and configure a Flask app instance for testing."""
     if not HAS_APP_FACTORY:
         pytest.skip("Flask app factory not yet implemented")
-    app = create_app({'TESTING': True, 'SECRET_KEY': 'test-secret-key', 'DEFAULT_FDPS': []})
+    app = create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'test-secret-key',
+        'DEFAULT_FDPS': [],
+        'DATASET_CACHE_DIR': str(tmp_path),
+    })
     yield app
 
 
@@ -40,32 +45,29 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture
+# The RDF fixtures are session-scoped: each file is read once per test run.
+@pytest.fixture(scope='session')
 def sample_fdp_root_rdf() -> str:
     """Load the sample FDP root RDF fixture."""
-    with open(FIXTURES_DIR / 'fdp_root.ttl', 'r') as f:
-        return f.read()
+    return (FIXTURES_DIR / 'fdp_root.ttl').read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_catalog_rdf() -> str:
     """Load the sample catalog RDF fixture."""
-    with open(FIXTURES_DIR / 'fdp_catalog.ttl', 'r') as f:
-        return f.read()
+    return (FIXTURES_DIR / 'fdp_catalog.ttl').read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_dataset_rdf() -> str:
     """Load the sample dataset RDF fixture."""
-    with open(FIXTURES_DIR / 'dataset.ttl', 'r') as f:
-        return f.read()
+    return (FIXTURES_DIR / 'dataset.ttl').read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_fdp_index_rdf() -> str:
     """Load the sample FDP index RDF fixture."""
-    with open(FIXTURES_DIR / 'fdp_index.ttl', 'r') as f:
-        return f.read()
+    return (FIXTURES_DIR / 'fdp_index.ttl').read_text()
 
 
 @pytest.fixture
@@ -1,10 +1,15 @@
 """Tests for the Dataset Service."""
 
 import pytest
-from unittest.mock import Mock, MagicMock
-
-from app.models import Dataset, ContactPoint
-from app.services.dataset_service import DatasetService, Theme
+from unittest.mock import Mock
+
+from app.models import Dataset, ContactPoint, FairDataPoint
+from app.services.dataset_service import (
+    DatasetService,
+    SearchIndex,
+    Theme,
+    to_cached_dataset,
+)
 from app.services.fdp_client import FDPClient, FDPConnectionError
 
 
@@ -157,6 +162,70 @@ class TestDatasetServiceSearch:
         assert len(result) >= 1
         assert 'Species' in result[0].title
 
+    def test_search_folds_non_ascii_case(self):
+        """Test that search matches non-ASCII text case-insensitively."""
+        datasets = [
+            Dataset(uri='u1', title='Straße und Verkehr', catalog_uri='c',
+                    fdp_uri='f', fdp_title='F'),
+        ]
+
+        assert DatasetService.search(datasets, 'STRASSE') == datasets
+        assert SearchIndex(datasets).search('strasse') == datasets
+
+    def test_search_and_filter_cached_rows(self, sample_datasets):
+        """Test that search and filters accept cached dataset rows."""
+        cached = [to_cached_dataset(ds) for ds in sample_datasets]
+
+        result = DatasetService.search(cached, 'species')
+        assert result[0].title == 'Species Distribution Maps'
+
+        result = DatasetService.filter_by_theme(cached, 'http://www.wikidata.org/entity/Q47041')
+        assert len(result) == 2
+
+    def test_available_themes_from_cached_rows(self, sample_datasets):
+        """Test that theme facets over cached rows match those over Datasets."""
+        cached = [to_cached_dataset(ds) for ds in sample_datasets]
+
+        themes = DatasetService.get_available_themes(cached)
+        assert themes == DatasetService.get_available_themes(sample_datasets)
+        assert 'Biodiversity' in [t.label for t in themes]
+
+    def test_search_index_matches_search(self, sample_datasets):
+        """Test that SearchIndex returns the same results as search()."""
+        cached = [to_cached_dataset(ds) for ds in sample_datasets]
+        index = SearchIndex(cached)
+
+        for query in ['species', 'climate data', 'SPEC', 'genom', 'nothing-matches', '']:
+            assert index.search(query) == DatasetService.search(cached, query)
+
+    def test_search_index_with_theme(self, sample_datasets):
+        """Test that the theme index matches filter_by_theme()."""
+        index = SearchIndex(sample_datasets)
+
+        for ds in sample_datasets:
+            for theme_uri in ds.themes:
+                assert index.with_theme(theme_uri) == DatasetService.filter_by_theme(
+                    sample_datasets, theme_uri
+                )
+        assert index.with_theme('http://example.org/no-such-theme') == []
+
+    def test_search_index_exact_bonuses(self):
+        """Test exact title and keyword bonuses in SearchIndex scoring."""
+        datasets = [
+            Dataset(uri='u1', title='Climate', catalog_uri='c', fdp_uri='f',
+                    fdp_title='F', keywords=['climate change']),
+            Dataset(uri='u2', title='Weather', catalog_uri='c', fdp_uri='f',
+                    fdp_title='F', keywords=['climate'], description='Climate data'),
+            Dataset(uri='u3', title='Climate models', catalog_uri='c', fdp_uri='f',
+                    fdp_title='F', theme_labels=['Climate']),
+        ]
+        index = SearchIndex(datasets)
+
+        for query in ['climate', 'climate change', 'change', 'mod', 'weather data']:
+            assert index.search(query) == DatasetService.search(datasets, query)
+        assert [ds.uri for ds in index.search('climate')] == ['u1', 'u3', 'u2']
+
+
 
 class TestDatasetServiceThemes:
     """Tests for DatasetService theme extraction."""
@@ -212,9 +281,11 @@ class TestDatasetServiceGetAll:
 
     def test_get_all_datasets_success(self, mock_fdp_client):
         """Test successfully fetching all datasets."""
-        mock_fdp = MagicMock()
-        mock_fdp.title = 'Test FDP'
-        mock_fdp.catalogs = ['https://example.org/catalog/1']
+        fdp = FairDataPoint(
+            uri='https://example.org/fdp',
+            title='Test FDP',
+            catalogs=['https://example.org/catalog/1'],
+        )
 
         mock_dataset = Dataset(
             uri='https://example.org/dataset/1',
@@ -224,7 +295,7 @@ class TestDatasetServiceGetAll:
             fdp_title='Test FDP',
         )
 
-        mock_fdp_client.fetch_fdp.return_value = mock_fdp
+        mock_fdp_client.fetch_fdp.return_value = fdp
         mock_fdp_client.fetch_catalog_with_datasets.return_value = [mock_dataset]
 
         service = DatasetService(mock_fdp_client)
@@ -233,6 +304,54 @@ class TestDatasetServiceGetAll:
         assert len(result) == 1
         assert result[0].title == 'Test Dataset'
 
+    def test_iter_all_datasets_stops_early(self, mock_fdp_client):
+        """Test that iteration can stop after the first dataset."""
+        fdp = FairDataPoint(
+            uri='https://example.org/fdp',
+            title='Test FDP',
+            catalogs=['https://example.org/catalog/1'],
+        )
+
+        mock_fdp_client.fetch_fdp.return_value = fdp
+        mock_fdp_client.fetch_catalog_with_datasets.return_value = [
+            Dataset(uri=f'https://example.org/dataset/{i}', title=f'Dataset {i}',
+                    catalog_uri='https://example.org/catalog/1',
+                    fdp_uri='https://example.org/fdp', fdp_title='Test FDP')
+            for i in range(3)
+        ]
+
+        service = DatasetService(mock_fdp_client)
+        datasets = service.iter_all_datasets(['https://example.org/fdp'])
+
+        assert next(datasets).title == 'Dataset 0'
+        datasets.close()
+
+    def test_get_all_datasets_bounded_pool(self, mock_fdp_client):
+        """Test that catalogs of every FDP are fetched with a bounded pool."""
+        def fetch_fdp(uri):
+            return FairDataPoint(uri=uri, title=uri, catalogs=[f'{uri}/catalog/1'])
+
+        def fetch_catalog(catalog_uri, fdp_uri, fdp_title):
+            return [Dataset(
+                uri=f'{catalog_uri}/dataset/1',
+                title='Dataset',
+                catalog_uri=catalog_uri,
+                fdp_uri=fdp_uri,
+                fdp_title=fdp_title,
+            )]
+
+        mock_fdp_client.fetch_fdp.side_effect = fetch_fdp
+        mock_fdp_client.fetch_catalog_with_datasets.side_effect = fetch_catalog
+
+        service = DatasetService(mock_fdp_client, max_workers=2)
+        result = service.get_all_datasets(
+            ['https://a.example.org', 'https://b.example.org', 'https://c.example.org']
+        )
+
+        assert sorted(ds.fdp_uri for ds in result) == [
+            'https://a.example.org', 'https://b.example.org', 'https://c.example.org'
+        ]
+
     def test_get_all_datasets_handles_fdp_error(self, mock_fdp_client):
         """Test that FDP errors are handled gracefully."""
         mock_fdp_client.fetch_fdp.side_effect = FDPConnectionError("Connection failed")
@@ -245,11 +364,13 @@ class TestDatasetServiceGetAll:
 
     def test_get_all_datasets_handles_catalog_error(self, mock_fdp_client):
         """Test that catalog errors are handled gracefully."""
-        mock_fdp = MagicMock()
-        mock_fdp.title = 'Test FDP'
-        mock_fdp.catalogs = ['https://example.org/catalog/1']
+        fdp = FairDataPoint(
+            uri='https://example.org/fdp',
+            title='Test FDP',
+            catalogs=['https://example.org/catalog/1'],
+        )
 
-        mock_fdp_client.fetch_fdp.return_value = mock_fdp
+        mock_fdp_client.fetch_fdp.return_value = fdp
         mock_fdp_client.fetch_catalog_with_datasets.side_effect = FDPConnectionError("Connection failed")
 
         service = DatasetService(mock_fdp_client)
@@ -260,12 +381,14 @@ class TestDatasetServiceGetAll:
 
     def test_get_all_datasets_handles_dataset_error(self, mock_fdp_client):
         """Test that catalog-level errors still return other datasets."""
-        mock_fdp = MagicMock()
-        mock_fdp.title = 'Test FDP'
-        mock_fdp.catalogs = [
-            'https://example.org/catalog/1',
-            'https://example.org/catalog/2',
-        ]
+        fdp = FairDataPoint(
+            uri='https://example.org/fdp',
+            title='Test FDP',
+            catalogs=[
+                'https://example.org/catalog/1',
+                'https://example.org/catalog/2',
+            ],
+        )
 
         mock_dataset = Dataset(
             uri='https://example.org/dataset/2',
@@ -275,7 +398,7 @@ class TestDatasetServiceGetAll:
             fdp_title='Test FDP',
         )
 
-        mock_fdp_client.fetch_fdp.return_value = mock_fdp
+        mock_fdp_client.fetch_fdp.return_value = fdp
         # First catalog fails, second succeeds
         mock_fdp_client.fetch_catalog_with_datasets.side_effect = [
             FDPConnectionError("Connection failed"),
@@ -291,13 +414,17 @@ class TestDatasetServiceGetAll:
 
     def test_get_all_datasets_multiple_fdps(self, mock_fdp_client):
         """Test fetching from multiple FDPs."""
-        mock_fdp1 = MagicMock()
-        mock_fdp1.title = 'FDP 1'
-        mock_fdp1.catalogs = ['https://example.org/catalog/1']
+        fdp1 = FairDataPoint(
+            uri='https://example.org/fdp',
+            title='FDP 1',
+            catalogs=['https://example.org/catalog/1'],
+        )
 
-        mock_fdp2 = MagicMock()
-        mock_fdp2.title = 'FDP 2'
-        mock_fdp2.catalogs = ['https://other.org/catalog/1']
+        fdp2 = FairDataPoint(
+            uri='https://other.org/fdp',
+            title='FDP 2',
+            catalogs=['https://other.org/catalog/1'],
+        )
 
         mock_dataset1 = Dataset(
             uri='https://example.org/dataset/1',
@@ -315,7 +442,7 @@ class TestDatasetServiceGetAll:
             fdp_title='FDP 2',
         )
 
-        mock_fdp_client.fetch_fdp.side_effect = [mock_fdp1, mock_fdp2]
+        mock_fdp_client.fetch_fdp.side_effect = [fdp1, fdp2]
         mock_fdp_client.fetch_catalog_with_datasets.side_effect = [
             [mock_dataset1],
             [mock_dataset2],
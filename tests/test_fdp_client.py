@@ -1,16 +1,27 @@
 """Tests for the FDP Client."""
 
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
 import pytest
 import responses
+from rdflib import URIRef
 from requests.exceptions import Timeout, ConnectionError as RequestsConnectionError
 
+from app.services import fdp_client as fdp_client_module
 from app.services.fdp_client import (
+    MAX_FETCH_WORKERS,
     FDPClient,
     FDPError,
     FDPConnectionError,
     FDPParseError,
     FDPTimeoutError,
+    _init_process_client,
 )
+from app.models import FairDataPoint
 
 
 class TestFDPClientFetchFDP:
@@ -56,6 +67,39 @@ class TestFDPClientFetchFDP:
         assert 'https://university-a.example.org/fdp' in fdp.linked_fdps
         assert 'https://university-b.example.org/fdp' in fdp.linked_fdps
 
+    @responses.activate
+    def test_fetch_fdp_hextuples(self):
+        """Test parsing an FDP served as Hextuples (NDJSON)."""
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp',
+            body=(
+                '["https://example.org/fdp", "http://purl.org/dc/terms/title", '
+                '"Hext FDP", "http://www.w3.org/2001/XMLSchema#string", "", ""]\n'
+            ),
+            content_type='application/hex+x-ndjson',
+        )
+
+        client = FDPClient()
+        fdp = client.fetch_fdp('https://example.org/fdp')
+
+        assert fdp.title == 'Hext FDP'
+
+    @responses.activate
+    def test_fetch_fdp_ntriples(self):
+        """Test parsing an FDP served as N-Triples."""
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp',
+            body='<https://example.org/fdp> <http://purl.org/dc/terms/title> "NT FDP" .\n',
+            content_type='application/n-triples',
+        )
+
+        client = FDPClient()
+        fdp = client.fetch_fdp('https://example.org/fdp')
+
+        assert fdp.title == 'NT FDP'
+
     @responses.activate
     def test_fetch_fdp_connection_error(self):
         """Test handling of connection errors."""
@@ -118,6 +162,78 @@ class TestFDPClientFetchFDP:
         assert 'timed out' in str(exc_info.value)
 
 
+    def test_fetch_fdp_read_timeout_is_not_retried(self):
+        """Test that a hung server fails once, as a timeout."""
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(8)
+        accepted = []
+
+        def accept():
+            # Accept connections but never answer them
+            while True:
+                try:
+                    accepted.append(server.accept()[0])
+                except OSError:
+                    return
+
+        threading.Thread(target=accept, daemon=True).start()
+        uri = f'http://127.0.0.1:{server.getsockname()[1]}/fdp'
+        try:
+            client = FDPClient(timeout=0.2)
+            started = time.monotonic()
+            with pytest.raises(FDPTimeoutError):
+                client.fetch_fdp(uri)
+            assert time.monotonic() - started < 1
+            assert len(accepted) == 1
+        finally:
+            server.close()
+            for conn in accepted:
+                conn.close()
+
+    @responses.activate
+    def test_fetch_fdp_gateway_error_after_retries(self):
+        """Test that a persistent gateway error surfaces as a connection error."""
+        responses.add(responses.GET, 'https://example.org/fdp', status=503)
+
+        client = FDPClient()
+        with pytest.raises(FDPConnectionError) as exc_info:
+            client.fetch_fdp('https://example.org/fdp')
+
+        assert '503' in str(exc_info.value)
+
+
+    def test_fetch_fdp_ignores_retry_after(self):
+        """Test that a large Retry-After does not stretch gateway retries."""
+        requests_seen = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(self.path)
+                self.send_response(503)
+                self.send_header('Retry-After', '120')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = FDPClient(timeout=1)
+            started = time.monotonic()
+            with pytest.raises(FDPConnectionError):
+                client.fetch_fdp(f'http://127.0.0.1:{server.server_port}/fdp')
+            assert time.monotonic() - started < 1.5
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # The original request plus three retries
+        assert len(requests_seen) == 4
+
+
 class TestFDPClientFetchDataset:
     """Tests for FDPClient.fetch_dataset()."""
 
@@ -230,9 +346,8 @@ class TestFDPClientFetchDataset:
             'Example FAIR Data Point'
         )
 
-        assert dataset.issued is not None
-        assert dataset.issued.year == 2023
-        assert dataset.modified is not None
+        assert dataset.issued == '2023-06-15'
+        assert dataset.modified == '2023-12-01'
 
     @responses.activate
     def test_fetch_dataset_connection_error(self):
@@ -271,6 +386,121 @@ class TestFDPClientHelpers:
         assert client_default.timeout == 30
 
 
+class TestFDPClientConditionalRequests:
+    """Tests for ETag revalidation in FDPClient._fetch_rdf()."""
+
+    @responses.activate
+    def test_not_modified_reuses_parsed_graph(self, sample_fdp_root_rdf: str):
+        """Test that a 304 response returns the previously parsed graph."""
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp',
+            body=sample_fdp_root_rdf,
+            content_type='text/turtle',
+            headers={'ETag': '"v1"'},
+        )
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp',
+            status=304,
+            match=[responses.matchers.header_matcher({'If-None-Match': '"v1"'})],
+        )
+
+        client = FDPClient()
+        first = client._fetch_rdf('https://example.org/fdp')
+        second = client._fetch_rdf('https://example.org/fdp')
+
+        assert second is first
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_max_age_serves_graph_without_request(self, sample_fdp_root_rdf: str):
+        """Test that a fresh max-age entry is reused until the cache is cleared."""
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp',
+            body=sample_fdp_root_rdf,
+            content_type='text/turtle',
+            headers={'Cache-Control': 'public, max-age=300'},
+        )
+
+        client = FDPClient()
+        first = client._fetch_rdf('https://example.org/fdp')
+        second = client._fetch_rdf('https://example.org/fdp')
+
+        assert second is first
+        assert len(responses.calls) == 1
+
+        client.clear_cache()
+        client._fetch_rdf('https://example.org/fdp')
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_relative_iris_resolve_against_document(self):
+        """Test that relative IRIs in a document resolve against its URI."""
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp/',
+            body='<catalog/1> <http://purl.org/dc/terms/title> "Catalog" .',
+            content_type='text/turtle',
+        )
+
+        graph = FDPClient()._fetch_rdf('https://example.org/fdp/')
+
+        assert set(graph.subjects()) == {URIRef('https://example.org/fdp/catalog/1')}
+
+    @responses.activate
+    def test_cache_bounded_by_triples(self, sample_fdp_root_rdf: str):
+        """Test that the least recently used graph is evicted over the triple budget."""
+        for uri in ('https://example.org/a', 'https://example.org/b'):
+            responses.add(
+                responses.GET,
+                uri,
+                body=sample_fdp_root_rdf,
+                content_type='text/turtle',
+                headers={'Cache-Control': 'public, max-age=300'},
+            )
+
+        size = len(FDPClient(rdf_cache_triples=0)._fetch_rdf('https://example.org/a'))
+        client = FDPClient(rdf_cache_triples=size + 1)
+        client._fetch_rdf('https://example.org/a')
+        client._fetch_rdf('https://example.org/b')
+        assert client._rdf_cache_triples == size
+        assert len(responses.calls) == 3
+
+        client._fetch_rdf('https://example.org/b')
+        assert len(responses.calls) == 3
+        client._fetch_rdf('https://example.org/a')
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_revalidating_view_skips_max_age(self, sample_fdp_root_rdf: str):
+        """Test that a revalidating view refetches but keeps the shared cache."""
+        responses.add(
+            responses.GET,
+            'https://example.org/fdp',
+            body=sample_fdp_root_rdf,
+            content_type='text/turtle',
+            headers={'Cache-Control': 'public, max-age=300'},
+        )
+
+        client = FDPClient()
+        client._fetch_rdf('https://example.org/fdp')
+        view = client.revalidating()
+        view._fetch_rdf('https://example.org/fdp')
+        assert len(responses.calls) == 2
+
+        # The refetched entry is shared and fresh again for the parent
+        client._fetch_rdf('https://example.org/fdp')
+        assert len(responses.calls) == 2
+
+        # Closing a view leaves the parent's session usable
+        view.close()
+        client.clear_cache()
+        client._fetch_rdf('https://example.org/fdp')
+        assert len(responses.calls) == 3
+
+
 class TestFDPClientIndexDiscovery:
     """Tests for FDP index discovery functionality."""
 
@@ -309,6 +539,66 @@ class TestFDPClientIndexDiscovery:
         assert fdps[0].uri == 'https://index.example.org/fdp'
         assert fdps[0].is_index is True
 
+    @responses.activate
+    def test_fetch_all_from_index_skips_self_link(
+        self, sample_fdp_index_rdf: str, sample_fdp_root_rdf: str
+    ):
+        """Test that an index listing itself is not fetched again."""
+        self_link = (
+            '<https://index.example.org/fdp> '
+            'fdp:metadataService <https://index.example.org/fdp> .\n'
+        )
+        responses.add(
+            responses.GET,
+            'https://index.example.org/fdp',
+            body=sample_fdp_index_rdf + self_link,
+            content_type='text/turtle',
+        )
+        for uri in ('https://university-a.example.org/fdp',
+                    'https://university-b.example.org/fdp'):
+            responses.add(
+                responses.GET, uri, body=sample_fdp_root_rdf, content_type='text/turtle'
+            )
+
+        client = FDPClient()
+        fdps = client.fetch_all_from_index('https://index.example.org/fdp')
+
+        assert [fdp.uri for fdp in fdps].count('https://index.example.org/fdp') == 1
+        assert len(fdps) == 3
+
+    @responses.activate
+    def test_fetch_all_from_index_fetches_duplicates_once(self, sample_fdp_root_rdf: str):
+        """Test that an FDP listed twice by the index is fetched once."""
+        responses.add(
+            responses.GET,
+            'https://university-a.example.org/fdp',
+            body=sample_fdp_root_rdf,
+            content_type='text/turtle',
+        )
+        index = FairDataPoint(
+            uri='https://index.example.org/fdp',
+            title='Index',
+            is_index=True,
+            linked_fdps=[
+                'https://university-a.example.org/fdp',
+                'https://university-a.example.org/fdp',
+            ],
+        )
+
+        client = FDPClient()
+        fetch_fdp = client.fetch_fdp
+        with patch.object(
+            client, 'fetch_fdp',
+            side_effect=lambda uri: index if uri == index.uri else fetch_fdp(uri),
+        ):
+            fdps = client.fetch_all_from_index(index.uri)
+
+        assert [fdp.uri for fdp in fdps] == [
+            'https://index.example.org/fdp',
+            'https://university-a.example.org/fdp',
+        ]
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_fetch_all_from_index_partial_failure(
         self, sample_fdp_index_rdf: str, sample_fdp_root_rdf: str
@@ -346,6 +636,73 @@ class TestFDPClientIndexDiscovery:
         assert error_fdp.status == 'error'
         assert error_fdp.error_message is not None
 
+    def test_fetch_all_from_index_process_mode(
+        self, sample_fdp_index_rdf: str, sample_fdp_root_rdf: str
+    ):
+        """Test that process mode fetches linked FDPs in spawned workers."""
+        # Worker processes cannot see HTTP mocks, so serve real responses
+        server = HTTPServer(('127.0.0.1', 0), BaseHTTPRequestHandler)
+        base = f'http://127.0.0.1:{server.server_port}'
+        index_rdf = (
+            sample_fdp_index_rdf
+            .replace('https://index.example.org/fdp', f'{base}/index')
+            .replace('https://university-a.example.org/fdp', f'{base}/a')
+            .replace('https://university-b.example.org/fdp', f'{base}/b')
+        )
+        bodies = {'/index': index_rdf, '/a': sample_fdp_root_rdf, '/b': sample_fdp_root_rdf}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = bodies[self.path].encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/turtle')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server.RequestHandlerClass = Handler
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with FDPClient(parallel_mode='process') as client:
+                fdps = client.fetch_all_from_index(f'{base}/index')
+                assert client._process_pool is not None
+            assert client._process_pool is None
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert fdps[0].uri == f'{base}/index'
+        assert [fdp.uri for fdp in fdps[1:]] == list(fdps[0].linked_fdps)
+        assert sorted(fdps[0].linked_fdps) == [f'{base}/a', f'{base}/b']
+        assert all(fdp.status == 'active' for fdp in fdps)
+
+    def test_invalid_parallel_mode(self):
+        """Test that an unknown parallel mode is rejected."""
+        with pytest.raises(ValueError):
+            FDPClient(parallel_mode='fibers')
+
+    def test_process_workers_capped(self):
+        """Test that the worker pool size is capped at MAX_FETCH_WORKERS."""
+        assert FDPClient(process_workers=2).process_workers == 2
+        assert FDPClient(process_workers=1000).process_workers == MAX_FETCH_WORKERS
+
+    def test_process_worker_client_has_no_cache(self):
+        """Test that worker clients keep no RDF cache the parent cannot clear."""
+        with patch.object(fdp_client_module, '_process_client', None):
+            _init_process_client(5, True)
+            assert fdp_client_module._process_client._rdf_cache_max_triples == 0
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the with-block closes the pooled session."""
+        client = FDPClient()
+        with patch.object(client._session, 'close') as close:
+            with client as entered:
+                assert entered is client
+        close.assert_called_once()
+
     @responses.activate
     def test_fetch_all_from_index_connection_error(self):
         """Test that index connection error propagates."""
@@ -275,8 +275,8 @@ class TestFetchCatalogWithDatasets:
         assert beta.description == 'Second dataset'
         assert beta.publisher is None
         assert beta.contact_point is None
-        assert beta.keywords == []
-        assert beta.themes == []
+        assert beta.keywords == ()
+        assert beta.themes == ()
 
     @responses.activate
     def test_discovers_datasets_via_ldp_container(self):
@@ -662,10 +662,8 @@ class TestFetchDatasetDistributions:
             'Test FDP',
         )
 
-        assert dataset.issued is not None
-        assert dataset.issued.year == 2024
-        assert dataset.issued.month == 1
-        assert dataset.modified is not None
+        assert dataset.issued == '2024-01-15'
+        assert dataset.modified.startswith('2024-06-01T12:00:00')
 
 
 # ===========================================================================
@@ -1,20 +1,25 @@
 """Integration tests for the fairdataspace application."""
 
+import gc
+from unittest.mock import patch
+
 import pytest
 import responses
 from flask import session
 
 from app import create_app
+from app.services import FDPClient
 
 
 @pytest.fixture
-def app():
+def app(tmp_path):
     """Create application for testing."""
     app = create_app({
         'TESTING': True,
         'SECRET_KEY': 'test-secret-key',
         'WTF_CSRF_ENABLED': False,
         'DEFAULT_FDPS': [],
+        'DATASET_CACHE_DIR': str(tmp_path),
     })
     yield app
 
@@ -25,7 +30,7 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_fdp_rdf():
     """Sample FDP RDF data."""
     return """
@@ -43,7 +48,7 @@ def sample_fdp_rdf():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_catalog_rdf():
     """Sample Catalog RDF data."""
     return """
@@ -58,7 +63,7 @@ def sample_catalog_rdf():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_dataset_rdf():
     """Sample Dataset RDF data."""
     return """
@@ -80,6 +85,24 @@ def sample_dataset_rdf():
     """
 
 
+class TestAppFactory:
+    """Test application setup and teardown."""
+
+    def test_fdp_client_closed_with_app(self, tmp_path):
+        """Test that the shared FDP client is closed once its app is collected."""
+        with patch.object(FDPClient, 'close') as close:
+            app = create_app({
+                'TESTING': True,
+                'SECRET_KEY': 'test-secret-key',
+                'DEFAULT_FDPS': [],
+                'DATASET_CACHE_DIR': str(tmp_path),
+            })
+            close.assert_not_called()
+            del app
+            gc.collect()
+            close.assert_called_once()
+
+
 class TestIndexRoute:
     """Test the landing page."""
 
@@ -153,6 +176,34 @@ class TestDatasetRoutes:
         response = client.get('/datasets/?q=test&sort=title')
         assert response.status_code == 200
 
+    def test_browse_first_page_is_sorted(self, app, client):
+        """Test that a partially sorted first page matches a full sort."""
+        from app.models import Dataset
+        from app.services.dataset_service import CACHED_DATASET_FIELDS, to_cached_dataset
+
+        rows = [
+            to_cached_dataset(Dataset(
+                uri=f'https://example.org/dataset/{i}',
+                title=f'Dataset {i:02d}',
+                catalog_uri='https://example.org/catalog/1',
+                fdp_uri='https://example.org/fdp',
+                fdp_title='FDP',
+            ))
+            for i in reversed(range(50))
+        ]
+        app.extensions['dataset_cache'].set(
+            'sorted-page-test', {'fields': list(CACHED_DATASET_FIELDS), 'rows': rows}
+        )
+        with client.session_transaction() as sess:
+            sess['datasets_cache_key'] = 'sorted-page-test'
+
+        response = client.get('/datasets/?sort=title')
+        assert response.status_code == 200
+        body = response.data.decode()
+        positions = [body.index(f'Dataset {i:02d}') for i in range(10)]
+        assert positions == sorted(positions)
+        assert 'Dataset 10' not in body
+
     def test_refresh_without_fdps(self, client):
         """Test refresh without FDPs configured."""
         response = client.post('/datasets/refresh', follow_redirects=True)
@@ -160,6 +211,42 @@ class TestDatasetRoutes:
         assert b'No FDPs configured' in response.data
 
 
+    @responses.activate
+    def test_refresh_bypasses_rdf_cache(
+        self, client, sample_fdp_rdf, sample_catalog_rdf, sample_dataset_rdf
+    ):
+        """Test that an explicit refresh refetches documents still fresh per max-age."""
+        for uri, body in [
+            ('https://example.org/fdp', sample_fdp_rdf),
+            ('https://example.org/catalog/1', sample_catalog_rdf),
+            ('https://example.org/dataset/1', sample_dataset_rdf),
+        ]:
+            responses.add(
+                responses.GET, uri, body=body, content_type='text/turtle',
+                headers={'Cache-Control': 'max-age=300'},
+            )
+        with client.session_transaction() as sess:
+            sess['fdps'] = {'fdp1': {'uri': 'https://example.org/fdp'}}
+
+        responses.add(
+            responses.GET, 'https://other.example.org/fdp', body=sample_fdp_rdf,
+            content_type='text/turtle', headers={'Cache-Control': 'max-age=300'},
+        )
+        fdp_client = client.application.extensions['fdp_client']
+        fdp_client._fetch_rdf('https://other.example.org/fdp')
+
+        client.post('/datasets/refresh')
+        client.post('/datasets/refresh')
+
+        fdp_calls = [c for c in responses.calls if c.request.url == 'https://example.org/fdp']
+        assert len(fdp_calls) == 2
+
+        # Documents cached for other users survive the refresh
+        fdp_client._fetch_rdf('https://other.example.org/fdp')
+        other_calls = [c for c in responses.calls if c.request.url == 'https://other.example.org/fdp']
+        assert len(other_calls) == 1
+
+
 class TestRequestRoutes:
     """Test request composition routes."""
 
@@ -189,6 +276,10 @@ class TestRequestRoutes:
         assert response.status_code == 200
         assert b'Basket cleared' in response.data
 
+        with client.session_transaction() as sess:
+            assert sess['basket'] == []
+            assert sess['basket_uris'] == []
+
 
 class TestFullWorkflow:
     """Test the complete workflow from adding FDP to composing request."""
@@ -304,6 +395,24 @@ class TestSessionPersistence:
         assert b'Test Dataset' in response.data
 
 
+    def test_legacy_md5_hashes_are_migrated(self, client):
+        """Test that sessions keyed by MD5 URI hashes are re-keyed on access."""
+        import hashlib
+        from app.utils import get_uri_hash
+
+        fdp_uri = 'https://example.org/fdp'
+        legacy_hash = hashlib.md5(fdp_uri.encode()).hexdigest()
+        with client.session_transaction() as sess:
+            sess['fdps'] = {legacy_hash: {'uri': fdp_uri, 'title': 'Test'}}
+            sess['basket'] = [{'uri': 'test', 'uri_hash': 'old', 'title': 'T', 'fdp_title': 'F'}]
+
+        client.get('/fdp/')
+
+        with client.session_transaction() as sess:
+            assert list(sess['fdps']) == [get_uri_hash(fdp_uri)]
+            assert sess['basket'][0]['uri_hash'] == get_uri_hash('test')
+
+
 class TestErrorHandling:
     """Test error handling across routes."""
 
@@ -1,14 +1,14 @@
 """Tests for SPARQL routes."""
 
-import hashlib
-
 import pytest
 import responses
 
+from app.utils import get_uri_hash
+
 
 def _ep_hash(url: str) -> str:
-    """Generate the same MD5 hash used by the application."""
-    return hashlib.md5(url.encode()).hexdigest()
+    """Generate the same URI hash used by the application."""
+    return get_uri_hash(url)
 
 
 # Reusable session helpers